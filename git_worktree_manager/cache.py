@@ -2,10 +2,12 @@
 
 import hashlib
 import json
+import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from threading import Lock
-from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -17,6 +19,7 @@ class CacheEntry(Generic[T]):
     value: T
     timestamp: float
     ttl: float  # Time to live in seconds
+    size: int = 0  # Approximate size of the value in bytes
 
     def is_expired(self) -> bool:
         """Check if the cache entry has expired."""
@@ -34,6 +37,7 @@ class GitOperationsCache:
         """
         self.default_ttl = default_ttl
         self._cache: Dict[str, CacheEntry] = {}
+        self._bytes = 0
         self._lock = Lock()
         self._stats = {"hits": 0, "misses": 0, "evictions": 0}
 
@@ -53,7 +57,7 @@ class GitOperationsCache:
                 return None
 
             if entry.is_expired():
-                del self._cache[key]
+                self._remove(key)
                 self._stats["evictions"] += 1
                 self._stats["misses"] += 1
                 return None
@@ -70,11 +74,29 @@ class GitOperationsCache:
             ttl: Time-to-live in seconds (uses default if None)
         """
         effective_ttl = ttl if ttl is not None else self.default_ttl
+        size = sys.getsizeof(value)
 
         with self._lock:
+            self._remove(key)
             self._cache[key] = CacheEntry(
-                value=value, timestamp=time.time(), ttl=effective_ttl
+                value=value, timestamp=time.time(), ttl=effective_ttl, size=size
             )
+            self._bytes += size
+
+    def _remove(self, key: str) -> bool:
+        """Remove an entry and update the byte count.
+
+        Must be called with the lock held.
+
+        Returns:
+            True if key was found and removed, False otherwise
+        """
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return False
+
+        self._bytes -= entry.size
+        return True
 
     def invalidate(self, key: str) -> bool:
         """Invalidate a specific cache entry.
@@ -86,10 +108,7 @@ class GitOperationsCache:
             True if key was found and removed, False otherwise
         """
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                return True
-            return False
+            return self._remove(key)
 
     def invalidate_pattern(self, pattern: str) -> int:
         """Invalidate all cache entries matching a pattern.
@@ -103,13 +122,14 @@ class GitOperationsCache:
         with self._lock:
             keys_to_remove = [key for key in self._cache.keys() if pattern in key]
             for key in keys_to_remove:
-                del self._cache[key]
+                self._remove(key)
             return len(keys_to_remove)
 
     def clear(self) -> None:
         """Clear all cache entries."""
         with self._lock:
             self._cache.clear()
+            self._bytes = 0
             self._stats = {"hits": 0, "misses": 0, "evictions": 0}
 
     def cleanup_expired(self) -> int:
@@ -127,7 +147,7 @@ class GitOperationsCache:
             ]
 
             for key in expired_keys:
-                del self._cache[key]
+                self._remove(key)
 
             self._stats["evictions"] += len(expired_keys)
             return len(expired_keys)
@@ -150,6 +170,7 @@ class GitOperationsCache:
                 "evictions": self._stats["evictions"],
                 "hit_rate": hit_rate,
                 "cache_size": len(self._cache),
+                "cache_bytes": self._bytes,
                 "total_requests": total_requests,
             }
 
@@ -177,6 +198,212 @@ class GitOperationsCache:
         return result
 
 
+class DiffCache:
+    """Two-layer cache for diff summaries.
+
+    Recently used results live in a small LRU "hot" layer. Entries evicted
+    from the hot layer are demoted to a larger "cold" layer gated by TTL,
+    and promoted back to the hot layer when they are read again.
+    """
+
+    def __init__(
+        self,
+        hot_size: int = 32,
+        cold_size: int = 500,
+        default_ttl: float = 300.0,
+    ):
+        """Initialize the diff cache.
+
+        Args:
+            hot_size: Maximum number of entries in the hot LRU layer
+            cold_size: Maximum number of entries in the cold layer
+            default_ttl: Default time-to-live for cache entries in seconds
+        """
+        self.hot_size = hot_size
+        self.cold_size = cold_size
+        self.default_ttl = default_ttl
+        self._hot: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._cold: Dict[Hashable, CacheEntry] = {}
+        self._bytes = 0
+        self._lock = Lock()
+        self._stats = {"hot_hits": 0, "cold_hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a value from the cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if found and not expired, None otherwise
+        """
+        with self._lock:
+            entry = self._hot.get(key)
+            if entry is not None:
+                if entry.is_expired():
+                    del self._hot[key]
+                    self._bytes -= entry.size
+                    self._stats["evictions"] += 1
+                    self._stats["misses"] += 1
+                    return None
+
+                self._hot.move_to_end(key)
+                self._stats["hot_hits"] += 1
+                return entry.value
+
+            entry = self._cold.pop(key, None)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+
+            if entry.is_expired():
+                self._bytes -= entry.size
+                self._stats["evictions"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            # Promote back to the hot layer
+            self._put_hot(key, entry)
+            self._stats["cold_hits"] += 1
+            return entry.value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Set a value in the hot layer of the cache.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds (uses default if None)
+        """
+        effective_ttl = ttl if ttl is not None else self.default_ttl
+        entry = CacheEntry(
+            value=value,
+            timestamp=time.time(),
+            ttl=effective_ttl,
+            size=sys.getsizeof(value),
+        )
+
+        with self._lock:
+            self._remove(key)
+            self._bytes += entry.size
+            self._put_hot(key, entry)
+
+    def _put_hot(self, key: Hashable, entry: CacheEntry) -> None:
+        """Insert an entry into the hot layer, demoting the LRU entry if full.
+
+        Must be called with the lock held.
+        """
+        self._hot[key] = entry
+        self._hot.move_to_end(key)
+
+        if len(self._hot) > self.hot_size:
+            old_key, old_entry = self._hot.popitem(last=False)
+            self._cold[old_key] = old_entry
+
+            if len(self._cold) > self.cold_size:
+                # Dicts preserve insertion order, so the first key is the oldest
+                self._bytes -= self._cold.pop(next(iter(self._cold))).size
+                self._stats["evictions"] += 1
+
+    def _remove(self, key: Hashable) -> bool:
+        """Remove an entry from either layer and update the byte count.
+
+        Must be called with the lock held.
+
+        Returns:
+            True if key was found and removed, False otherwise
+        """
+        entry = self._hot.pop(key, None)
+        if entry is None:
+            entry = self._cold.pop(key, None)
+        if entry is None:
+            return False
+
+        self._bytes -= entry.size
+        return True
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Invalidate a specific cache entry.
+
+        Args:
+            key: Cache key to invalidate
+
+        Returns:
+            True if key was found and removed, False otherwise
+        """
+        with self._lock:
+            return self._remove(key)
+
+    def invalidate_session(self) -> int:
+        """Drop every cached diff, e.g. after the repository changed.
+
+        Returns:
+            Number of entries invalidated
+        """
+        with self._lock:
+            count = len(self._hot) + len(self._cold)
+            self._hot.clear()
+            self._cold.clear()
+            self._bytes = 0
+            return count
+
+    def cleanup_expired(self) -> int:
+        """Remove all expired entries from both layers.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            expired_keys = [
+                key
+                for layer in (self._hot, self._cold)
+                for key, entry in layer.items()
+                if entry.is_expired()
+            ]
+
+            for key in expired_keys:
+                self._remove(key)
+
+            self._stats["evictions"] += len(expired_keys)
+            return len(expired_keys)
+
+    def clear(self) -> None:
+        """Clear all cache entries and reset statistics."""
+        with self._lock:
+            self._hot.clear()
+            self._cold.clear()
+            self._bytes = 0
+            self._stats = {
+                "hot_hits": 0,
+                "cold_hits": 0,
+                "misses": 0,
+                "evictions": 0,
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics, broken down by layer.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        with self._lock:
+            hits = self._stats["hot_hits"] + self._stats["cold_hits"]
+            total_requests = hits + self._stats["misses"]
+
+            return {
+                "hot_hits": self._stats["hot_hits"],
+                "cold_hits": self._stats["cold_hits"],
+                "hits": hits,
+                "misses": self._stats["misses"],
+                "evictions": self._stats["evictions"],
+                "hit_rate": hits / total_requests if total_requests > 0 else 0.0,
+                "hot_size": len(self._hot),
+                "cold_size": len(self._cold),
+                "cache_bytes": self._bytes,
+                "total_requests": total_requests,
+            }
+
+
 def create_cache_key(*args, **kwargs) -> str:
     """Create a consistent cache key from arguments.
 
@@ -204,7 +431,10 @@ class CacheConfig:
     CURRENT_BRANCH_TTL = 30.0  # 30 seconds - current branch can change frequently
     WORKTREE_LIST_TTL = 30.0  # 30 seconds - worktree list can change
     DIFF_SUMMARY_TTL = 300.0  # 5 minutes - diff summaries can change with commits
+    RESOLVED_REF_TTL = 5.0  # 5 seconds - branch tips move when commits are made
 
     # Maximum cache sizes
     MAX_COMMIT_INFO_ENTRIES = 1000
     MAX_DIFF_SUMMARY_ENTRIES = 500
+    HOT_DIFF_SUMMARY_ENTRIES = 32  # Recently viewed diffs kept in the LRU layer
+    MAX_RESOLVED_REF_ENTRIES = 64
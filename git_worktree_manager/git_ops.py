@@ -1,10 +1,15 @@
 """Git operations module for worktree management."""
 
+import io
+import re
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from types import TracebackType
+from typing import AnyStr, Dict, List, Optional, Tuple, Type, Union, cast
 
-from .cache import CacheConfig, GitOperationsCache, create_cache_key
+from .cache import CacheConfig, DiffCache, GitOperationsCache, create_cache_key
 from .error_recovery import get_error_recovery_manager
 from .exceptions import (
     GitRepositoryError,
@@ -12,6 +17,80 @@ from .exceptions import (
 )
 from .models import CommitInfo, DiffSummary, WorktreeInfo
 
+# Full SHA-1 or SHA-256 object name
+_FULL_SHA_PATTERN = re.compile(r"^(?:[0-9a-f]{40}|[0-9a-f]{64})$")
+
+
+class _GitProcess:
+    """Context manager running a git command with a kill timer.
+
+    Stderr is drained by a background thread so a chatty command can't block
+    while the caller reads stdout. The timer kills the command once the
+    timeout expires, and the command is also killed if the block raises.
+    """
+
+    def __init__(self, cmd: List[str], cwd: str, timeout: float, bufsize: int = -1):
+        self.cmd = cmd
+        self.cwd = cwd
+        self.timeout = timeout
+        self.bufsize = bufsize
+        self.stderr = b""
+        self.timed_out = threading.Event()
+
+    def __enter__(self) -> "_GitProcess":
+        self.process = subprocess.Popen(
+            self.cmd,
+            cwd=self.cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=self.bufsize,
+        )
+        assert self.process.stdout is not None
+        assert self.process.stderr is not None
+        # Pipes opened with a non-zero bufsize are buffered readers
+        self.stdout = cast(io.BufferedReader, self.process.stdout)
+        self._stderr_reader = threading.Thread(target=self._read_stderr, daemon=True)
+        self._stderr_reader.start()
+        self._timer = threading.Timer(self.timeout, self._kill)
+        self._timer.daemon = True
+        self._timer.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        try:
+            if exc_type is not None:
+                self.process.kill()
+            self.process.wait()
+        except BaseException:
+            self.process.kill()
+            raise
+        finally:
+            self._timer.cancel()
+            self._timer.join()
+            self._stderr_reader.join()
+            self.stdout.close()
+            assert self.process.stderr is not None
+            self.process.stderr.close()
+
+    @property
+    def returncode(self) -> int:
+        """Exit status of the command once the block has exited."""
+        assert self.process.returncode is not None
+        return self.process.returncode
+
+    def _read_stderr(self) -> None:
+        assert self.process.stderr is not None
+        self.stderr = self.process.stderr.read()
+
+    def _kill(self) -> None:
+        self.timed_out.set()
+        self.process.kill()
+
 
 class GitOperations:
     """Handles all Git operations for worktree management."""
@@ -26,6 +105,26 @@ class GitOperations:
         self.repo_path = repo_path
         self.enable_cache = enable_cache
         self._cache = GitOperationsCache() if enable_cache else None
+        self._diff_cache = (
+            DiffCache(
+                hot_size=CacheConfig.HOT_DIFF_SUMMARY_ENTRIES,
+                cold_size=CacheConfig.MAX_DIFF_SUMMARY_ENTRIES,
+                default_ttl=CacheConfig.DIFF_SUMMARY_TTL,
+            )
+            if enable_cache
+            else None
+        )
+        self._metrics_lock = threading.Lock()
+        # Tiny LRU of ref name -> commit SHA, without a cold layer
+        self._sha_cache = (
+            DiffCache(
+                hot_size=CacheConfig.MAX_RESOLVED_REF_ENTRIES,
+                cold_size=0,
+                default_ttl=CacheConfig.RESOLVED_REF_TTL,
+            )
+            if enable_cache
+            else None
+        )
 
     def is_git_repository(self) -> bool:
         """Check if the current directory is a Git repository.
@@ -117,12 +216,12 @@ class GitOperations:
 
         except subprocess.CalledProcessError as e:
             raise GitRepositoryError(
-                f"Failed to get branches: {e.stderr.decode() if e.stderr else str(e)}",
+                f"Failed to get branches: {e.stderr.decode('utf-8', 'replace') if e.stderr else str(e)}",
                 user_guidance="Ensure you are in a valid Git repository with proper permissions",
                 error_code="GET_BRANCHES_FAILED",
                 git_command="git branch",
                 exit_code=e.returncode,
-                stderr=e.stderr.decode() if e.stderr else None,
+                stderr=e.stderr.decode("utf-8", "replace") if e.stderr else None,
             ) from e
         except FileNotFoundError:
             raise git_not_installed_error() from None
@@ -177,12 +276,12 @@ class GitOperations:
 
         except subprocess.CalledProcessError as e:
             raise GitRepositoryError(
-                f"Failed to get current branch: {e.stderr.decode() if e.stderr else str(e)}",
+                f"Failed to get current branch: {e.stderr.decode('utf-8', 'replace') if e.stderr else str(e)}",
                 user_guidance="Ensure you are in a valid Git repository",
                 error_code="GET_CURRENT_BRANCH_FAILED",
                 git_command="git branch --show-current",
                 exit_code=e.returncode,
-                stderr=e.stderr.decode() if e.stderr else None,
+                stderr=e.stderr.decode("utf-8", "replace") if e.stderr else None,
             ) from e
         except FileNotFoundError:
             raise git_not_installed_error() from None
@@ -215,12 +314,12 @@ class GitOperations:
 
         except subprocess.CalledProcessError as e:
             raise GitRepositoryError(
-                f"Failed to list worktrees: {e.stderr.decode() if e.stderr else str(e)}",
+                f"Failed to list worktrees: {e.stderr.decode('utf-8', 'replace') if e.stderr else str(e)}",
                 user_guidance="Ensure you are in a valid Git repository with worktrees",
                 error_code="LIST_WORKTREES_FAILED",
                 git_command="git worktree list --porcelain",
                 exit_code=e.returncode,
-                stderr=e.stderr.decode() if e.stderr else None,
+                stderr=e.stderr.decode("utf-8", "replace") if e.stderr else None,
             )
         except FileNotFoundError:
             raise git_not_installed_error()
@@ -398,7 +497,7 @@ class GitOperations:
             return self._parse_commit_info(result.stdout.strip())
 
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.decode() if e.stderr else str(e)
+            error_msg = e.stderr.decode("utf-8", "replace") if e.stderr else str(e)
             raise GitRepositoryError(
                 f"Failed to get commit info for '{branch_or_hash}': {error_msg}",
                 user_guidance="Ensure the branch or commit hash exists and is accessible",
@@ -558,15 +657,96 @@ class GitOperations:
         Raises:
             GitRepositoryError: If Git command fails or branches not found
         """
-        if not self.enable_cache or self._cache is None:
+        if not self.enable_cache or self._diff_cache is None:
             return self._get_diff_summary_uncached(branch1, branch2)
 
-        cache_key = create_cache_key("diff_summary", self.repo_path, branch1, branch2)
-        return self._cache.cached_call(
-            cache_key,
-            lambda: self._get_diff_summary_uncached(branch1, branch2),
-            CacheConfig.DIFF_SUMMARY_TTL,
-        )
+        # Key on commit SHAs so refs pointing at the same commits share entries
+        # and moving a branch tip naturally misses the cache
+        cache_key = self._resolve_shas(branch1, branch2)
+        cached: Optional[DiffSummary] = self._diff_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Diff the resolved SHAs themselves, so the result always matches its
+        # key even if a ref moves or a recently resolved SHA is reused
+        sha1, sha2 = cache_key
+        diff_summary = self._get_diff_summary_uncached(sha1, sha2)
+        self._diff_cache.set(cache_key, diff_summary)
+        return diff_summary
+
+    def get_diff_summaries_batch(
+        self, pairs: List[Tuple[str, str]], max_workers: int = 4
+    ) -> List[DiffSummary]:
+        """Get diff summaries for several branch pairs concurrently.
+
+        Each pair is computed with get_diff_summary on a thread pool, so the
+        git processes for different pairs run in parallel.
+
+        Args:
+            pairs: List of (branch1, branch2) tuples to compare
+            max_workers: Maximum number of concurrent git processes
+
+        Returns:
+            List of DiffSummary objects in the same order as pairs
+
+        Raises:
+            GitRepositoryError: If any diff calculation fails
+        """
+        if not pairs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.get_diff_summary, branch1, branch2)
+                for branch1, branch2 in pairs
+            ]
+            return [future.result() for future in futures]
+
+    def _resolve_shas(self, *refs: str) -> Tuple[str, ...]:
+        """Resolve refs to full commit SHAs with a single 'git rev-parse' call.
+
+        Full SHAs are returned as-is and recently resolved refs are served
+        from a short-lived cache. If resolution fails, the ref names
+        themselves are returned so callers can still use them as a key.
+
+        Args:
+            *refs: Branch names, commit hashes or other revisions
+
+        Returns:
+            Tuple of SHAs (or the original refs) in the same order as given
+        """
+        resolved: Dict[str, str] = {}
+        for ref in refs:
+            if _FULL_SHA_PATTERN.match(ref):
+                resolved[ref] = ref
+            elif self._sha_cache is not None:
+                sha = self._sha_cache.get(ref)
+                if sha is not None:
+                    resolved[ref] = sha
+
+        unresolved = [ref for ref in dict.fromkeys(refs) if ref not in resolved]
+        if unresolved:
+            try:
+                result = subprocess.run(
+                    ["git", "rev-parse", *unresolved],
+                    cwd=self.repo_path,
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                )
+                shas = result.stdout.split() if result.returncode == 0 else []
+            except Exception:
+                shas = []
+
+            if len(shas) == len(unresolved) and all(
+                _FULL_SHA_PATTERN.match(sha) for sha in shas
+            ):
+                for ref, sha in zip(unresolved, shas):
+                    resolved[ref] = sha
+                    if self._sha_cache is not None:
+                        self._sha_cache.set(ref, sha)
+
+        return tuple(resolved.get(ref, ref) for ref in refs)
 
     def _get_diff_summary_uncached(self, branch1: str, branch2: str) -> DiffSummary:
         """Get diff summary between two branches without caching."""
@@ -575,30 +755,26 @@ class GitOperations:
         start_time = time.time()
 
         try:
-            # Use optimized git diff command with --numstat for better performance
-            # and --find-renames to handle file renames efficiently
-            result = subprocess.run(
+            # Use optimized git diff command with --numstat for better performance.
+            # Only file counts are reported, so rename detection is skipped, and
+            # -z gives NUL-terminated records without locale-dependent quoting
+            output = self._run_git(
                 [
                     "git",
                     "diff",
                     "--numstat",
-                    "--find-renames",
+                    "-z",
+                    "--no-renames",
                     f"{branch1}...{branch2}",
                 ],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True,
                 timeout=30,  # Add timeout to prevent hanging on large diffs
             )
 
-            diff_summary = self._parse_diff_numstat(result.stdout)
+            diff_summary = self._parse_diff_numstat(output)
 
             # Record performance metrics
             execution_time = time.time() - start_time
-            self._record_performance_metric(
-                "diff_summary", execution_time, len(result.stdout)
-            )
+            self._record_performance_metric("diff_summary", execution_time, len(output))
 
             return diff_summary
 
@@ -609,12 +785,12 @@ class GitOperations:
                 error_code="DIFF_TIMEOUT",
             ) from None
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.decode() if e.stderr else str(e)
+            error_msg = e.stderr.decode("utf-8", "replace") if e.stderr else str(e)
             raise GitRepositoryError(
                 f"Failed to get diff summary between '{branch1}' and '{branch2}': {error_msg}",
                 user_guidance="Ensure both branches exist and are accessible",
                 error_code="GET_DIFF_SUMMARY_FAILED",
-                git_command=f"git diff --numstat {branch1}...{branch2}",
+                git_command=f"git diff --numstat -z --no-renames {branch1}...{branch2}",
                 exit_code=e.returncode,
                 stderr=error_msg,
             ) from e
@@ -725,6 +901,10 @@ class GitOperations:
     def invalidate_cache(self, pattern: Optional[str] = None) -> int:
         """Invalidate cache entries.
 
+        Diff summaries live in their own cache keyed by commit SHAs, so they
+        can't be matched by ref name and are all dropped when the pattern
+        starts with "diff_summary".
+
         Args:
             pattern: Pattern to match cache keys (invalidates all if None)
 
@@ -736,9 +916,16 @@ class GitOperations:
 
         if pattern is None:
             self._cache.clear()
+            if self._diff_cache is not None:
+                self._diff_cache.clear()
+            if self._sha_cache is not None:
+                self._sha_cache.clear()
             return 0  # clear() doesn't return count
         else:
-            return self._cache.invalidate_pattern(pattern)
+            count = self._cache.invalidate_pattern(pattern)
+            if self._diff_cache is not None and pattern.startswith("diff_summary"):
+                count += self._diff_cache.invalidate_session()
+            return count
 
     def invalidate_branches_cache(self) -> bool:
         """Invalidate cached branch information.
@@ -787,6 +974,8 @@ class GitOperations:
     ) -> int:
         """Invalidate cached diff summary information.
 
+        Invalidating everything also forgets the resolved ref SHAs.
+
         Args:
             branch1: First branch to invalidate (all if None)
             branch2: Second branch to invalidate (all if None)
@@ -794,20 +983,24 @@ class GitOperations:
         Returns:
             Number of entries invalidated
         """
-        if not self.enable_cache or self._cache is None:
+        if not self.enable_cache or self._diff_cache is None:
             return 0
 
         if branch1 is None or branch2 is None:
-            return self._cache.invalidate_pattern("diff_summary")
+            # Drop resolved refs too, so the next lookup sees current tips
+            if self._sha_cache is not None:
+                self._sha_cache.clear()
+            return self._diff_cache.invalidate_session()
         else:
-            cache_key = create_cache_key(
-                "diff_summary", self.repo_path, branch1, branch2
-            )
-            return 1 if self._cache.invalidate(cache_key) else 0
+            cache_key = self._resolve_shas(branch1, branch2)
+            return 1 if self._diff_cache.invalidate(cache_key) else 0
 
     def get_cache_stats(self) -> Dict[str, any]:
         """Get cache performance statistics.
 
+        Totals include the diff summary cache, whose per-layer statistics
+        are also reported under "diff_cache".
+
         Returns:
             Dictionary with cache statistics
         """
@@ -818,10 +1011,27 @@ class GitOperations:
                 "misses": 0,
                 "hit_rate": 0.0,
                 "cache_size": 0,
+                "cache_bytes": 0,
             }
 
         stats = self._cache.get_stats()
         stats["enabled"] = True
+
+        if self._diff_cache is not None:
+            diff_stats = self._diff_cache.get_stats()
+            stats["hits"] += diff_stats["hits"]
+            stats["misses"] += diff_stats["misses"]
+            stats["evictions"] += diff_stats["evictions"]
+            stats["total_requests"] += diff_stats["total_requests"]
+            stats["cache_size"] += diff_stats["hot_size"] + diff_stats["cold_size"]
+            stats["cache_bytes"] += diff_stats["cache_bytes"]
+            stats["hit_rate"] = (
+                stats["hits"] / stats["total_requests"]
+                if stats["total_requests"] > 0
+                else 0.0
+            )
+            stats["diff_cache"] = diff_stats
+
         return stats
 
     def cleanup_expired_cache(self) -> int:
@@ -833,13 +1043,18 @@ class GitOperations:
         if not self.enable_cache or self._cache is None:
             return 0
 
-        return self._cache.cleanup_expired()
+        removed = self._cache.cleanup_expired()
+        if self._diff_cache is not None:
+            removed += self._diff_cache.cleanup_expired()
+        return removed
 
-    def _parse_diff_numstat(self, numstat_output: str) -> DiffSummary:
+    def _parse_diff_numstat(self, numstat_output: Union[str, bytes]) -> DiffSummary:
         """Parse the output of 'git diff --numstat' for better performance.
 
         Args:
-            numstat_output: Raw output from git diff --numstat
+            numstat_output: Raw output from git diff --numstat (NUL-terminated
+                records when run with -z, newline-terminated otherwise), either
+                decoded or as the raw bytes read from git
 
         Returns:
             DiffSummary object with parsed statistics
@@ -854,47 +1069,13 @@ class GitOperations:
                 summary_text="No changes",
             )
 
-        lines = numstat_output.strip().split("\n")
-
-        files_modified = 0
-        files_added = 0
-        files_deleted = 0
-        total_insertions = 0
-        total_deletions = 0
-
-        for line in lines:
-            if not line.strip():
-                continue
-
-            # Format: "insertions\tdeletions\tfilename"
-            parts = line.split("\t")
-            if len(parts) >= 3:
-                insertions_str, deletions_str, filename = parts[0], parts[1], parts[2]
-
-                # Handle binary files (marked with "-")
-                if insertions_str == "-" or deletions_str == "-":
-                    # Binary file - count as modified
-                    files_modified += 1
-                    continue
-
-                try:
-                    insertions = int(insertions_str) if insertions_str != "-" else 0
-                    deletions = int(deletions_str) if deletions_str != "-" else 0
-
-                    total_insertions += insertions
-                    total_deletions += deletions
-
-                    # Determine file status
-                    if insertions > 0 and deletions == 0:
-                        files_added += 1
-                    elif insertions == 0 and deletions > 0:
-                        files_deleted += 1
-                    else:
-                        files_modified += 1
-
-                except ValueError:
-                    # Handle malformed lines
-                    files_modified += 1
+        (
+            files_modified,
+            files_added,
+            files_deleted,
+            total_insertions,
+            total_deletions,
+        ) = self._parse_diff_numstat_fused(numstat_output)
 
         # Create summary text
         if total_insertions == 0 and total_deletions == 0:
@@ -916,6 +1097,176 @@ class GitOperations:
             summary_text=summary_text,
         )
 
+    def _parse_diff_numstat_fused(
+        self, numstat_output: Union[str, bytes]
+    ) -> Tuple[int, int, int, int, int]:
+        """Parse numstat output straight into aggregate counters.
+
+        Splitting, parsing and summing happen in a single pass over the
+        records, without building any per-file objects. Bytes are parsed
+        as-is, so callers reading from a pipe don't need to decode first.
+
+        Args:
+            numstat_output: Raw output from git diff --numstat, with or without -z
+
+        Returns:
+            Tuple of (files_modified, files_added, files_deleted,
+            total_insertions, total_deletions)
+        """
+        if isinstance(numstat_output, bytes):
+            separator = b"\x00" if b"\x00" in numstat_output else b"\n"
+            return self._sum_numstat_records(
+                numstat_output.split(separator), b"\t", b"-"
+            )
+
+        text_separator = "\x00" if "\x00" in numstat_output else "\n"
+        return self._sum_numstat_records(
+            numstat_output.split(text_separator), "\t", "-"
+        )
+
+    def _sum_numstat_records(
+        self, records: List[AnyStr], tab: AnyStr, binary: AnyStr
+    ) -> Tuple[int, int, int, int, int]:
+        """Sum split numstat records of either str or bytes into counters.
+
+        Args:
+            records: Numstat records, one per file
+            tab: Field separator of the same type as the records
+            binary: Count placeholder git writes for binary files
+
+        Returns:
+            Tuple of (files_modified, files_added, files_deleted,
+            total_insertions, total_deletions)
+        """
+        files_modified = 0
+        files_added = 0
+        files_deleted = 0
+        total_insertions = 0
+        total_deletions = 0
+
+        for record in records:
+            # Format: "insertions\tdeletions\tfilename"
+            parts = record.split(tab, 2)
+            if len(parts) < 3:
+                continue
+
+            insertions_str, deletions_str = parts[0], parts[1]
+
+            # Handle binary files (marked with "-")
+            if insertions_str == binary or deletions_str == binary:
+                # Binary file - count as modified
+                files_modified += 1
+                continue
+
+            try:
+                insertions = int(insertions_str)
+                deletions = int(deletions_str)
+            except ValueError:
+                # Handle malformed lines
+                files_modified += 1
+                continue
+
+            total_insertions += insertions
+            total_deletions += deletions
+
+            # Determine file status
+            if deletions == 0 and insertions > 0:
+                files_added += 1
+            elif insertions == 0 and deletions > 0:
+                files_deleted += 1
+            else:
+                files_modified += 1
+
+        return (
+            files_modified,
+            files_added,
+            files_deleted,
+            total_insertions,
+            total_deletions,
+        )
+
+    def _run_git(self, cmd: List[str], timeout: float) -> str:
+        """Run a git command that may produce large output.
+
+        Stdout is read through a large buffer in big chunks into a single
+        bytearray and decoded once at the end, keeping the number of read
+        syscalls and intermediate strings low for large diffs. Commands with
+        short output should keep using subprocess.run directly.
+
+        Args:
+            cmd: Git command to run
+            timeout: Seconds to wait before killing the command
+
+        Returns:
+            Decoded stdout of the command
+
+        Raises:
+            subprocess.CalledProcessError: If the command exits non-zero
+            subprocess.TimeoutExpired: If the command doesn't finish in time
+        """
+        output = bytearray()
+        with _GitProcess(cmd, self.repo_path, timeout, bufsize=1 << 20) as git:
+            read = git.stdout.read1
+            while True:
+                chunk = read(1 << 20)
+                if not chunk:
+                    break
+                output += chunk
+
+        if git.timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        if git.returncode != 0:
+            raise subprocess.CalledProcessError(
+                git.returncode, cmd, output=bytes(output), stderr=git.stderr
+            )
+
+        return output.decode("utf-8", "replace")
+
+    def _read_numstat_records(
+        self, cmd: List[str], max_records: int, timeout: float
+    ) -> bytes:
+        """Run a 'git diff --numstat -z' command, reading at most max_records.
+
+        Output is consumed from a pipe chunk by chunk, and git is terminated
+        as soon as enough NUL-terminated records have arrived, so the work
+        done is proportional to max_records rather than to the diff size.
+
+        Args:
+            cmd: Git command producing NUL-terminated numstat records
+            max_records: Maximum number of records to return
+            timeout: Seconds to wait before killing the command
+
+        Returns:
+            The first max_records records as raw bytes, NUL-terminated
+
+        Raises:
+            subprocess.CalledProcessError: If git fails before enough records
+                were read
+            subprocess.TimeoutExpired: If git doesn't finish in time
+        """
+        buffer = bytearray()
+        records_read = 0
+        with _GitProcess(cmd, self.repo_path, timeout) as git:
+            read = git.stdout.read1
+            while records_read < max_records:
+                chunk = read(65536)
+                if not chunk:
+                    break
+                buffer += chunk
+                records_read += chunk.count(b"\x00")
+
+            truncated = records_read >= max_records
+            if truncated and git.process.poll() is None:
+                git.process.terminate()
+
+        if git.timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        if not truncated and git.returncode != 0:
+            raise subprocess.CalledProcessError(git.returncode, cmd, stderr=git.stderr)
+
+        records = bytes(buffer).split(b"\x00", max_records)
+        return b"".join(record + b"\x00" for record in records[:max_records] if record)
+
     def _record_performance_metric(
         self, operation: str, execution_time: float, data_size: int
     ) -> None:
@@ -926,24 +1277,25 @@ class GitOperations:
             execution_time: Time taken to execute in seconds
             data_size: Size of data processed (e.g., output length)
         """
-        if not hasattr(self, "_performance_metrics"):
-            self._performance_metrics = {}
-
-        if operation not in self._performance_metrics:
-            self._performance_metrics[operation] = {
-                "total_calls": 0,
-                "total_time": 0.0,
-                "total_data_size": 0,
-                "max_time": 0.0,
-                "min_time": float("inf"),
-            }
+        with self._metrics_lock:
+            if not hasattr(self, "_performance_metrics"):
+                self._performance_metrics = {}
+
+            if operation not in self._performance_metrics:
+                self._performance_metrics[operation] = {
+                    "total_calls": 0,
+                    "total_time": 0.0,
+                    "total_data_size": 0,
+                    "max_time": 0.0,
+                    "min_time": float("inf"),
+                }
 
-        metrics = self._performance_metrics[operation]
-        metrics["total_calls"] += 1
-        metrics["total_time"] += execution_time
-        metrics["total_data_size"] += data_size
-        metrics["max_time"] = max(metrics["max_time"], execution_time)
-        metrics["min_time"] = min(metrics["min_time"], execution_time)
+            metrics = self._performance_metrics[operation]
+            metrics["total_calls"] += 1
+            metrics["total_time"] += execution_time
+            metrics["total_data_size"] += data_size
+            metrics["max_time"] = max(metrics["max_time"], execution_time)
+            metrics["min_time"] = min(metrics["min_time"], execution_time)
 
     def get_performance_metrics(self) -> Dict[str, Dict[str, float]]:
         """Get performance metrics for Git operations.
@@ -1004,33 +1356,17 @@ class GitOperations:
                 "git",
                 "diff",
                 "--numstat",
-                "--find-renames",
+                "-z",
+                "--no-renames",
                 f"{branch1}...{branch2}",
             ]
 
-            # Add file limit if specified
-            if max_files is not None:
-                # Use git diff with pathspec to limit files processed
-                # This is a simplified approach - in practice you might want to
-                # implement more sophisticated progressive loading
-                pass
-
-            result = subprocess.run(
-                cmd,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=30,
-            )
-
-            # If max_files is specified, limit the processing
-            output = result.stdout
-            if max_files is not None and output.strip():
-                lines = output.strip().split("\n")
-                if len(lines) > max_files:
-                    # Process only the first max_files lines
-                    output = "\n".join(lines[:max_files])
+            output: Union[str, bytes]
+            if max_files is None:
+                output = self._run_git(cmd, timeout=30)
+            else:
+                # Stream the output and stop git once enough files were read
+                output = self._read_numstat_records(cmd, max_files, timeout=30)
 
             diff_summary = self._parse_diff_numstat(output)
 
@@ -1049,12 +1385,12 @@ class GitOperations:
                 error_code="DIFF_PROGRESSIVE_TIMEOUT",
             ) from None
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.decode() if e.stderr else str(e)
+            error_msg = e.stderr.decode("utf-8", "replace") if e.stderr else str(e)
             raise GitRepositoryError(
                 f"Failed to get progressive diff summary between '{branch1}' and '{branch2}': {error_msg}",
                 user_guidance="Ensure both branches exist and are accessible",
                 error_code="GET_DIFF_PROGRESSIVE_FAILED",
-                git_command=f"git diff --numstat {branch1}...{branch2}",
+                git_command=f"git diff --numstat -z --no-renames {branch1}...{branch2}",
                 exit_code=e.returncode,
                 stderr=error_msg,
             ) from e
@@ -0,0 +1,241 @@
+"""Shared pytest configuration for the test suite."""
+
+from unittest.mock import DEFAULT, Mock, NonCallableMock
+
+import pytest
+
+from git_worktree_manager.config import ConfigManager
+from git_worktree_manager.git_ops import GitOperations
+from git_worktree_manager.models import CommitInfo, DiffSummary, WorktreeInfo
+from git_worktree_manager.ui_controller import UIController
+from git_worktree_manager.worktree_manager import WorktreeManager
+
+from .fakes import FakeConsole
+
+# Attribute names the dependency mocks accept, looked up once per process
+# rather than on every Mock(spec=...) construction
+_GIT_OPS_SPEC = dir(GitOperations)
+_UI_CONTROLLER_SPEC = dir(UIController)
+_CONFIG_MANAGER_SPEC = dir(ConfigManager)
+
+
+def pytest_addoption(parser):
+    """Register command line options for the test suite."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow",
+    )
+
+
+def pytest_configure(config):
+    """Register the custom markers used across the test suite."""
+    config.addinivalue_line("markers", "slow: heavy tests, skipped unless --run-slow")
+    config.addinivalue_line("markers", "performance: performance requirement checks")
+    config.addinivalue_line("markers", "integration: tests touching real git repos")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Group performance tests and skip slow tests unless requested.
+
+    Performance tests assert on wall-clock time, so they all run on one xdist
+    worker rather than competing with each other for CPU. This runs before
+    xdist reads the xdist_group marks.
+    """
+    run_slow = config.getoption("--run-slow")
+    performance_group = pytest.mark.xdist_group("performance")
+    skip_slow = pytest.mark.skip(reason="use --run-slow to run")
+    for item in items:
+        if "performance" in item.keywords:
+            item.add_marker(performance_group)
+        if not run_slow and "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+def _make_manager():
+    """Build a WorktreeManager wired to fresh spec'd mocks of its dependencies.
+
+    Returns:
+        Tuple of (manager, git_ops, ui_controller, config_manager)
+    """
+    git_ops = Mock(spec=_GIT_OPS_SPEC)
+    ui_controller = Mock(spec=_UI_CONTROLLER_SPEC)
+    config_manager = Mock(spec=_CONFIG_MANAGER_SPEC)
+    manager = WorktreeManager(
+        git_ops=git_ops,
+        ui_controller=ui_controller,
+        config_manager=config_manager,
+    )
+    return manager, git_ops, ui_controller, config_manager
+
+
+def _reset_mock(mock):
+    """Reset a mock's calls, return values and side effects, children included.
+
+    reset_mock(return_value=True, side_effect=True) only reaches the child
+    mocks from Python 3.9 on, so their configuration is cleared here instead.
+    """
+    mock.reset_mock()
+    pending = [mock]
+    while pending:
+        current = pending.pop()
+        current.side_effect = None
+        current.return_value = DEFAULT
+        pending.extend(
+            child
+            for child in current._mock_children.values()
+            if isinstance(child, NonCallableMock)
+        )
+
+
+@pytest.fixture
+def manager():
+    """WorktreeManager wired to fresh mocks, see _make_manager."""
+    return _make_manager()
+
+
+@pytest.fixture(scope="class")
+def manager_cls():
+    """WorktreeManager and mocks built once per test class.
+
+    Tests should request shared_manager, which resets it between tests.
+    """
+    return _make_manager()
+
+
+def _reset_manager(manager_cls):
+    """Clear a shared manager's caches and reset its mocks in place."""
+    manager, *mocks = manager_cls
+    manager._clear_caches()
+    for mock in mocks:
+        _reset_mock(mock)
+
+
+@pytest.fixture
+def shared_manager(manager_cls):
+    """Class-wide manager, reset around each test that reuses it.
+
+    The caches are cleared and the mocks' calls, return values and side
+    effects reset in place instead of rebuilding them, see _reset_mock.
+    Resetting on setup as well keeps each test independent of whatever ran
+    before it, and teardown leaves nothing behind for the rest of the class.
+    """
+    _reset_manager(manager_cls)
+    yield manager_cls
+    _reset_manager(manager_cls)
+
+
+@pytest.fixture(scope="session")
+def commit_info():
+    """Commit returned for newly created worktrees, shared across the session."""
+    return CommitInfo(
+        hash="abc123def456",
+        message="Test commit",
+        author="Test Author",
+        date=None,
+        short_hash="abc123d",
+    )
+
+
+@pytest.fixture
+def create_manager(manager, commit_info):
+    """Manager fixture whose mocks answer like a repo ready for a new worktree."""
+    _, git_ops, ui_controller, config_manager = manager
+
+    git_ops.configure_mock(
+        **{
+            "is_git_repository.return_value": True,
+            "get_branches.return_value": ("main", "develop", "feature/test"),
+            "get_current_branch.return_value": "main",
+            "create_worktree.return_value": None,
+            "get_commit_info.return_value": commit_info,
+            "_has_uncommitted_changes.return_value": False,
+        }
+    )
+    config_manager.configure_mock(
+        **{"get_default_worktree_location.return_value": "/home/user/worktrees"}
+    )
+    ui_controller.configure_mock(
+        **{
+            "prompt_branch_name.return_value": "feature/new-feature",
+            "select_base_branch.return_value": "main",
+            "select_worktree_location.return_value": (
+                "/home/user/worktrees/feature-new-feature"
+            ),
+        }
+    )
+    return manager
+
+
+@pytest.fixture(scope="session")
+def mock_console():
+    """Fake Rich console shared across the session.
+
+    Tests that inspect its recorded calls must reset() it first.
+    """
+    return FakeConsole()
+
+
+@pytest.fixture(scope="session")
+def sample_worktrees():
+    """Sample worktree data for display tests, shared across the session.
+
+    Returned as a tuple so tests can't accidentally add or remove entries.
+    """
+    return (
+        WorktreeInfo(
+            path="/home/user/project",
+            branch="main",
+            commit_hash="abc123def456",
+            commit_message="Initial commit",
+            base_branch=None,
+            is_bare=False,
+            has_uncommitted_changes=False,
+        ),
+        WorktreeInfo(
+            path="/home/user/worktrees/feature-branch",
+            branch="feature/new-feature",
+            commit_hash="def456ghi789",
+            commit_message="Add new feature implementation",
+            base_branch="main",
+            is_bare=False,
+            has_uncommitted_changes=True,
+        ),
+        WorktreeInfo(
+            path="/home/user/worktrees/bare-repo",
+            branch="develop",
+            commit_hash="ghi789jkl012",
+            commit_message="Development branch",
+            base_branch=None,
+            is_bare=True,
+            has_uncommitted_changes=False,
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_diff():
+    """Sample diff summary with changes, shared across the session."""
+    return DiffSummary(
+        files_modified=3,
+        files_added=2,
+        files_deleted=1,
+        total_insertions=150,
+        total_deletions=75,
+        summary_text="Modified core functionality and added tests",
+    )
+
+
+@pytest.fixture(scope="session")
+def empty_diff():
+    """Sample diff summary without changes, shared across the session."""
+    return DiffSummary(
+        files_modified=0,
+        files_added=0,
+        files_deleted=0,
+        total_insertions=0,
+        total_deletions=0,
+        summary_text="",
+    )
@@ -0,0 +1,60 @@
+"""Lightweight fakes shared by the test suite."""
+
+import io
+from types import SimpleNamespace
+from typing import Union
+from unittest.mock import Mock
+
+
+class CallRecorder:
+    """Callable that records the arguments of every call."""
+
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+
+
+class FakeConsole:
+    """Lightweight stand-in for the parts of a Rich console the tests use."""
+
+    __slots__ = ("print", "clear", "size", "get_time", "is_terminal")
+
+    def __init__(self):
+        self.print = CallRecorder()
+        self.clear = CallRecorder()
+        self.size = SimpleNamespace(width=80, height=24)
+        # Add required attributes for Progress
+        self.get_time = lambda: 0.0
+        self.is_terminal = True
+
+    def reset(self):
+        """Forget all recorded calls."""
+        self.print.calls.clear()
+        self.clear.calls.clear()
+
+
+def mock_git_process(
+    stdout: Union[str, bytes] = b"", returncode: int = 0, stderr: bytes = b""
+) -> Mock:
+    """Create a mock Popen process for git commands whose output is streamed.
+
+    Args:
+        stdout: Output the process writes, encoded to bytes if given as str
+        returncode: Exit status the process reports
+        stderr: Raw bytes the process writes to stderr
+
+    Returns:
+        Mock standing in for the subprocess.Popen instance
+    """
+    if isinstance(stdout, str):
+        stdout = stdout.encode()
+
+    process = Mock()
+    process.stdout = io.BytesIO(stdout)
+    process.stderr = io.BytesIO(stderr)
+    process.returncode = returncode
+    return process
@@ -1,11 +1,13 @@
 """Tests for the caching layer."""
 
+import sys
 import time
 from unittest.mock import Mock
 
 from git_worktree_manager.cache import (
     CacheConfig,
     CacheEntry,
+    DiffCache,
     GitOperationsCache,
     create_cache_key,
 )
@@ -149,6 +151,30 @@ class TestGitOperationsCache:
         assert stats["hits"] == 0
         assert stats["misses"] == 0
 
+    def test_cache_bytes_tracking(self):
+        """Test the cache keeps a running count of stored bytes."""
+        cache = GitOperationsCache()
+        value = "x" * 1000
+
+        cache.set("key1", value)
+        cache.set("key2", value)
+        assert cache.get_stats()["cache_bytes"] == 2 * sys.getsizeof(value)
+
+        # Overwriting replaces the old size instead of adding to it
+        cache.set("key1", value)
+        assert cache.get_stats()["cache_bytes"] == 2 * sys.getsizeof(value)
+
+        cache.invalidate("key1")
+        assert cache.get_stats()["cache_bytes"] == sys.getsizeof(value)
+
+        cache.invalidate_pattern("key")
+        assert cache.get_stats()["cache_bytes"] == 0
+
+        cache.set("key3", value, ttl=0.01)
+        time.sleep(0.02)
+        cache.cleanup_expired()
+        assert cache.get_stats()["cache_bytes"] == 0
+
     def test_cache_cleanup_expired(self):
         """Test cleanup of expired entries."""
         cache = GitOperationsCache()
@@ -213,6 +239,120 @@ class TestGitOperationsCache:
         assert all(result is not None for result in results)
 
 
+class TestDiffCache:
+    """Test DiffCache functionality."""
+
+    def test_diff_cache_set_and_get(self):
+        """Test setting and getting values from the hot layer."""
+        cache = DiffCache()
+
+        assert cache.get(("main", "dev", "abc123")) is None
+
+        cache.set(("main", "dev", "abc123"), "diff")
+        assert cache.get(("main", "dev", "abc123")) == "diff"
+
+        stats = cache.get_stats()
+        assert stats["hot_hits"] == 1
+        assert stats["cold_hits"] == 0
+        assert stats["misses"] == 1
+        assert stats["hot_size"] == 1
+
+    def test_diff_cache_demotes_to_cold_layer(self):
+        """Test LRU entries are demoted to the cold layer and promoted back."""
+        cache = DiffCache(hot_size=2, cold_size=10)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        stats = cache.get_stats()
+        assert stats["hot_size"] == 2
+        assert stats["cold_size"] == 1
+
+        # Reading "b" promotes it back to the hot layer
+        assert cache.get("b") == 2
+        stats = cache.get_stats()
+        assert stats["cold_hits"] == 1
+        assert stats["hot_size"] == 2
+        assert stats["cold_size"] == 1
+
+    def test_diff_cache_cold_layer_bounded(self):
+        """Test the cold layer drops its oldest entries when full."""
+        cache = DiffCache(hot_size=1, cold_size=2)
+
+        for i in range(5):
+            cache.set(i, i)
+
+        stats = cache.get_stats()
+        assert stats["hot_size"] == 1
+        assert stats["cold_size"] == 2
+        assert stats["evictions"] == 2
+        assert cache.get(0) is None
+        assert cache.get(4) == 4
+
+    def test_diff_cache_ttl(self):
+        """Test expired entries are not returned from either layer."""
+        cache = DiffCache(hot_size=1, default_ttl=0.1)
+
+        cache.set("a", 1)
+        cache.set("b", 2)  # Demotes "a" to the cold layer
+
+        time.sleep(0.15)
+
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+        assert cache.get_stats()["evictions"] == 2
+
+    def test_diff_cache_invalidation(self):
+        """Test invalidating single entries and whole sessions."""
+        cache = DiffCache(hot_size=1)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.invalidate("a") is True
+        assert cache.invalidate("a") is False
+        assert cache.get("a") is None
+
+        cache.set("c", 3)
+        assert cache.invalidate_session() == 2
+        assert cache.get("b") is None
+        assert cache.get("c") is None
+
+    def test_diff_cache_cleanup_expired(self):
+        """Test expired entries are removed from both layers."""
+        cache = DiffCache(hot_size=1)
+
+        cache.set("a", 1, ttl=0.01)
+        cache.set("b", 2, ttl=0.01)  # Demotes "a" to the cold layer
+        cache.set("c", 3)  # Demotes "b" to the cold layer
+        time.sleep(0.02)
+
+        assert cache.cleanup_expired() == 2
+        assert cache.get("c") == 3
+        assert cache.get_stats()["cold_size"] == 0
+
+    def test_diff_cache_bytes_tracking(self):
+        """Test the diff cache keeps a running count of stored bytes."""
+        cache = DiffCache(hot_size=1, cold_size=1)
+        value = "x" * 1000
+
+        cache.set("a", value)
+        cache.set("a", value)
+        assert cache.get_stats()["cache_bytes"] == sys.getsizeof(value)
+
+        cache.set("b", value)  # Demotes "a" to the cold layer
+        cache.set("c", value)  # Evicts "a"
+        assert cache.get_stats()["cache_bytes"] == 2 * sys.getsizeof(value)
+
+        cache.invalidate("b")
+        assert cache.get_stats()["cache_bytes"] == sys.getsizeof(value)
+
+        cache.invalidate_session()
+        assert cache.get_stats()["cache_bytes"] == 0
+
+
 class TestCreateCacheKey:
     """Test cache key creation."""
 
@@ -273,6 +413,7 @@ class TestCacheConfig:
 
         assert CacheConfig.MAX_COMMIT_INFO_ENTRIES == 1000
         assert CacheConfig.MAX_DIFF_SUMMARY_ENTRIES == 500
+        assert CacheConfig.HOT_DIFF_SUMMARY_ENTRIES == 32
 
 
 class TestCacheIntegration:
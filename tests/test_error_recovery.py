@@ -1,7 +1,7 @@
 """Unit tests for the error recovery module."""
 
 import subprocess
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -263,7 +263,7 @@ class TestWorktreeCleanupManager:
         manager = WorktreeCleanupManager("/test/repo")
 
         mock_exists.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = Mock(returncode=0)
 
         manager.cleanup_failed_worktree("/test/worktree", "test-branch")
 
@@ -453,7 +453,7 @@ class TestErrorRecoveryManager:
     @patch("subprocess.run")
     def test_check_git_availability_success(self, mock_run):
         """Test Git availability check with Git installed."""
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = Mock(returncode=0)
 
         manager = ErrorRecoveryManager()
         result = manager.check_git_availability()
@@ -466,7 +466,7 @@ class TestErrorRecoveryManager:
     @patch("subprocess.run")
     def test_check_git_availability_failure(self, mock_run):
         """Test Git availability check with Git not installed."""
-        mock_run.return_value = MagicMock(returncode=1)
+        mock_run.return_value = Mock(returncode=1)
 
         manager = ErrorRecoveryManager()
         result = manager.check_git_availability()
@@ -703,13 +703,13 @@ class TestIntegrationScenarios:
         # First two calls fail with transient error, third succeeds
         mock_run.side_effect = [
             # Git availability check
-            MagicMock(returncode=0),
+            Mock(returncode=0),
             # First attempt - transient failure
             subprocess.CalledProcessError(128, ["git", "branch"]),
             # Second attempt - transient failure
             subprocess.CalledProcessError(128, ["git", "branch"]),
             # Third attempt - success
-            MagicMock(returncode=0, stdout="main\nfeature\n"),
+            Mock(returncode=0, stdout="main\nfeature\n"),
         ]
 
         manager = ErrorRecoveryManager("/test/repo")
@@ -5,7 +5,7 @@ import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import List
-from unittest.mock import MagicMock, Mock
+from unittest.mock import Mock
 
 import pytest
 
@@ -210,9 +210,9 @@ class GitCommandMocker:
     """Utility for mocking Git command subprocess calls."""
 
     @staticmethod
-    def mock_git_command_success(stdout: str = "", returncode: int = 0) -> MagicMock:
+    def mock_git_command_success(stdout: str = "", returncode: int = 0) -> Mock:
         """Create a mock for successful Git command."""
-        mock_result = MagicMock()
+        mock_result = Mock()
         mock_result.stdout = stdout
         mock_result.returncode = returncode
         return mock_result
@@ -220,9 +220,9 @@ class GitCommandMocker:
     @staticmethod
     def mock_git_command_failure(
         returncode: int = 128, stderr: str = "Git error"
-    ) -> MagicMock:
+    ) -> Mock:
         """Create a mock for failed Git command."""
-        mock_result = MagicMock()
+        mock_result = Mock()
         mock_result.returncode = returncode
         mock_result.stderr = stderr
         return mock_result
@@ -1,13 +1,17 @@
 """Unit tests for GitOperations class."""
 
 import subprocess
+import sys
+import time
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
 from git_worktree_manager.git_ops import GitOperations, GitRepositoryError
 
+from .fakes import mock_git_process
+
 
 class TestGitOperations:
     """Test cases for GitOperations class."""
@@ -20,7 +24,7 @@ class TestGitOperations:
     def test_is_git_repository_valid_repo(self, mock_run):
         """Test is_git_repository returns True for valid Git repository."""
         # Mock successful git rev-parse command
-        mock_result = MagicMock()
+        mock_result = Mock()
         mock_result.returncode = 0
         mock_run.return_value = mock_result
 
@@ -39,7 +43,7 @@ class TestGitOperations:
     def test_is_git_repository_invalid_repo(self, mock_run):
         """Test is_git_repository returns False for non-Git directory."""
         # Mock failed git rev-parse command
-        mock_result = MagicMock()
+        mock_result = Mock()
         mock_result.returncode = 128  # Git error code for not a repository
         mock_run.return_value = mock_result
 
@@ -85,12 +89,12 @@ class TestGitOperations:
     def test_get_branches_success(self, mock_run):
         """Test get_branches returns sorted list of local and remote branches."""
         # Mock local branches result
-        local_result = MagicMock()
+        local_result = Mock()
         local_result.stdout = "main\nfeature-1\ndevelop\n"
         local_result.returncode = 0
 
         # Mock remote branches result
-        remote_result = MagicMock()
+        remote_result = Mock()
         remote_result.stdout = "origin/main\norigin/feature-2\norigin/HEAD\n"
         remote_result.returncode = 0
 
@@ -129,7 +133,7 @@ class TestGitOperations:
     def test_get_branches_empty_repo(self, mock_run):
         """Test get_branches handles empty repository."""
         # Mock empty results
-        empty_result = MagicMock()
+        empty_result = Mock()
         empty_result.stdout = ""
         empty_result.returncode = 0
 
@@ -161,7 +165,7 @@ class TestGitOperations:
     @patch("subprocess.run")
     def test_get_current_branch_success(self, mock_run):
         """Test get_current_branch returns current branch name."""
-        mock_result = MagicMock()
+        mock_result = Mock()
         mock_result.stdout = "feature-branch\n"
         mock_result.returncode = 0
         mock_run.return_value = mock_result
@@ -181,12 +185,12 @@ class TestGitOperations:
     def test_get_current_branch_detached_head(self, mock_run):
         """Test get_current_branch handles detached HEAD state."""
         # First call returns empty (detached HEAD)
-        first_result = MagicMock()
+        first_result = Mock()
         first_result.stdout = ""
         first_result.returncode = 0
 
         # Second call returns commit hash
-        second_result = MagicMock()
+        second_result = Mock()
         second_result.stdout = "abc1234\n"
         second_result.returncode = 0
 
@@ -233,7 +237,7 @@ class TestGitOperations:
     def test_list_worktrees_success(self, mock_run):
         """Test list_worktrees parses worktree output correctly."""
         # Mock git worktree list --porcelain output
-        mock_result = MagicMock()
+        mock_result = Mock()
         mock_result.stdout = """worktree /path/to/main
 HEAD abc1234567890abcdef1234567890abcdef12
 branch refs/heads/main
@@ -255,7 +259,7 @@ detached
                 return mock_result
             elif args[0][0:3] == ["git", "log", "--format=%s"]:
                 # Mock commit message calls
-                commit_result = MagicMock()
+                commit_result = Mock()
                 if "abc1234567890abcdef1234567890abcdef12" in args[0]:
                     commit_result.stdout = "Initial commit"
                 elif "def4567890abcdef1234567890abcdef123456" in args[0]:
@@ -265,10 +269,10 @@ detached
                 return commit_result
             elif args[0] == ["git", "status", "--porcelain"]:
                 # Mock status calls - no changes
-                status_result = MagicMock()
+                status_result = Mock()
                 status_result.stdout = ""
                 return status_result
-            return MagicMock()
+            return Mock()
 
         mock_run.side_effect = mock_run_side_effect
 
@@ -301,7 +305,7 @@ detached
     @patch("subprocess.run")
     def test_list_worktrees_empty(self, mock_run):
         """Test list_worktrees handles empty output."""
-        mock_result = MagicMock()
+        mock_result = Mock()
         mock_result.stdout = ""
         mock_result.returncode = 0
         mock_run.return_value = mock_result
@@ -313,7 +317,7 @@ detached
     @patch("subprocess.run")
     def test_list_worktrees_with_bare_repo(self, mock_run):
         """Test list_worktrees handles bare repository."""
-        mock_result = MagicMock()
+        mock_result = Mock()
         mock_result.stdout = """worktree /path/to/bare
 HEAD abc1234567890abcdef1234567890abcdef12
 bare
@@ -325,14 +329,14 @@ bare
             if args[0] == ["git", "worktree", "list", "--porcelain"]:
                 return mock_result
             elif args[0][0:3] == ["git", "log", "--format=%s"]:
-                commit_result = MagicMock()
+                commit_result = Mock()
                 commit_result.stdout = "Bare repo commit"
                 return commit_result
             elif args[0] == ["git", "status", "--porcelain"]:
-                status_result = MagicMock()
+                status_result = Mock()
                 status_result.stdout = ""
                 return status_result
-            return MagicMock()
+            return Mock()
 
         mock_run.side_effect = mock_run_side_effect
 
@@ -345,7 +349,7 @@ bare
     @patch("subprocess.run")
     def test_list_worktrees_with_uncommitted_changes(self, mock_run):
         """Test list_worktrees detects uncommitted changes."""
-        mock_result = MagicMock()
+        mock_result = Mock()
         mock_result.stdout = """worktree /path/to/dirty
 HEAD abc1234567890abcdef1234567890abcdef12
 branch refs/heads/main
@@ -357,15 +361,15 @@ branch refs/heads/main
             if args[0] == ["git", "worktree", "list", "--porcelain"]:
                 return mock_result
             elif args[0][0:3] == ["git", "log", "--format=%s"]:
-                commit_result = MagicMock()
+                commit_result = Mock()
                 commit_result.stdout = "Some commit"
                 return commit_result
             elif args[0] == ["git", "status", "--porcelain"]:
                 # Mock dirty status
-                status_result = MagicMock()
+                status_result = Mock()
                 status_result.stdout = " M modified_file.txt\n?? new_file.txt"
                 return status_result
-            return MagicMock()
+            return Mock()
 
         mock_run.side_effect = mock_run_side_effect
 
@@ -395,7 +399,7 @@ branch refs/heads/main
     @patch("subprocess.run")
     def test_get_commit_info_success(self, mock_run):
         """Test get_commit_info returns detailed commit information."""
-        mock_result = MagicMock()
+        mock_result = Mock()
         mock_result.stdout = "abc1234567890abcdef1234567890abcdef12|Initial commit|John Doe|2023-12-01T10:30:00+00:00|abc1234"
         mock_result.returncode = 0
         mock_run.return_value = mock_result
@@ -421,7 +425,7 @@ branch refs/heads/main
     @patch("subprocess.run")
     def test_get_commit_info_with_commit_hash(self, mock_run):
         """Test get_commit_info works with commit hash input."""
-        mock_result = MagicMock()
+        mock_result = Mock()
         mock_result.stdout = "def4567890abcdef1234567890abcdef123456|Feature commit|Jane Smith|2023-12-02T15:45:30+01:00|def4567"
         mock_result.returncode = 0
         mock_run.return_value = mock_result
@@ -444,7 +448,7 @@ branch refs/heads/main
     @patch("subprocess.run")
     def test_get_commit_info_no_commit_found(self, mock_run):
         """Test get_commit_info handles case when no commit is found."""
-        mock_result = MagicMock()
+        mock_result = Mock()
         mock_result.stdout = ""
         mock_result.returncode = 0
         mock_run.return_value = mock_result
@@ -457,7 +461,7 @@ branch refs/heads/main
     @patch("subprocess.run")
     def test_get_commit_info_invalid_format(self, mock_run):
         """Test get_commit_info handles invalid commit format."""
-        mock_result = MagicMock()
+        mock_result = Mock()
         mock_result.stdout = "invalid|format"  # Missing required fields
         mock_result.returncode = 0
         mock_run.return_value = mock_result
@@ -468,7 +472,7 @@ branch refs/heads/main
     @patch("subprocess.run")
     def test_get_commit_info_date_parsing_fallback(self, mock_run):
         """Test get_commit_info handles date parsing errors gracefully."""
-        mock_result = MagicMock()
+        mock_result = Mock()
         mock_result.stdout = "abc1234|Test commit|Author|invalid-date|abc1234"
         mock_result.returncode = 0
         mock_run.return_value = mock_result
@@ -510,12 +514,12 @@ branch refs/heads/main
             if args[0][0:2] == ["git", "branch"]:
                 if "--format=%(refname:short)" in args[0]:
                     # Local branches
-                    result = MagicMock()
+                    result = Mock()
                     result.stdout = "main\nexisting-branch\n"
                     return result
                 else:
                     # Remote branches
-                    result = MagicMock()
+                    result = Mock()
                     result.stdout = ""
                     return result
             elif args[0] == [
@@ -526,10 +530,10 @@ branch refs/heads/main
                 "existing-branch",
             ]:
                 # Worktree creation
-                result = MagicMock()
+                result = Mock()
                 result.returncode = 0
                 return result
-            return MagicMock()
+            return Mock()
 
         mock_run.side_effect = mock_run_side_effect
 
@@ -555,12 +559,12 @@ branch refs/heads/main
             if args[0][0:2] == ["git", "branch"]:
                 if "--format=%(refname:short)" in args[0]:
                     # Local branches
-                    result = MagicMock()
+                    result = Mock()
                     result.stdout = "main\n"
                     return result
                 else:
                     # Remote branches
-                    result = MagicMock()
+                    result = Mock()
                     result.stdout = ""
                     return result
             elif args[0] == [
@@ -573,10 +577,10 @@ branch refs/heads/main
                 "main",
             ]:
                 # Worktree creation with new branch
-                result = MagicMock()
+                result = Mock()
                 result.returncode = 0
                 return result
-            return MagicMock()
+            return Mock()
 
         mock_run.side_effect = mock_run_side_effect
 
@@ -602,17 +606,17 @@ branch refs/heads/main
             if args[0][0:2] == ["git", "branch"]:
                 if "--format=%(refname:short)" in args[0]:
                     # Local branches
-                    result = MagicMock()
+                    result = Mock()
                     result.stdout = "main\n"
                     return result
                 elif "--show-current" in args[0]:
                     # Current branch
-                    result = MagicMock()
+                    result = Mock()
                     result.stdout = "main\n"
                     return result
                 else:
                     # Remote branches
-                    result = MagicMock()
+                    result = Mock()
                     result.stdout = ""
                     return result
             elif args[0] == [
@@ -625,10 +629,10 @@ branch refs/heads/main
                 "main",
             ]:
                 # Worktree creation with new branch
-                result = MagicMock()
+                result = Mock()
                 result.returncode = 0
                 return result
-            return MagicMock()
+            return Mock()
 
         mock_run.side_effect = mock_run_side_effect
 
@@ -654,22 +658,22 @@ branch refs/heads/main
             if args[0][0:2] == ["git", "branch"]:
                 if "--format=%(refname:short)" in args[0]:
                     # Local branches
-                    result = MagicMock()
+                    result = Mock()
                     result.stdout = "main\n"
                     return result
                 elif "--show-current" in args[0]:
                     # Current branch (detached HEAD)
-                    result = MagicMock()
+                    result = Mock()
                     result.stdout = ""
                     return result
                 else:
                     # Remote branches
-                    result = MagicMock()
+                    result = Mock()
                     result.stdout = ""
                     return result
             elif args[0] == ["git", "rev-parse", "--short", "HEAD"]:
                 # Short commit hash for detached HEAD
-                result = MagicMock()
+                result = Mock()
                 result.stdout = "abc1234\n"
                 return result
             elif args[0] == [
@@ -682,10 +686,10 @@ branch refs/heads/main
                 "HEAD",
             ]:
                 # Worktree creation with HEAD as base
-                result = MagicMock()
+                result = Mock()
                 result.returncode = 0
                 return result
-            return MagicMock()
+            return Mock()
 
         mock_run.side_effect = mock_run_side_effect
 
@@ -712,12 +716,12 @@ branch refs/heads/main
             if args[0][0:2] == ["git", "branch"]:
                 if "--format=%(refname:short)" in args[0]:
                     # Local branches
-                    result = MagicMock()
+                    result = Mock()
                     result.stdout = "main\n"
                     return result
                 else:
                     # Remote branches
-                    result = MagicMock()
+                    result = Mock()
                     result.stdout = ""
                     return result
             elif args[0][0:3] == ["git", "worktree", "add"]:
@@ -725,7 +729,7 @@ branch refs/heads/main
                 raise subprocess.CalledProcessError(
                     128, ["git", "worktree", "add"], stderr=b"worktree add failed"
                 )
-            return MagicMock()
+            return Mock()
 
         mock_run.side_effect = mock_run_side_effect
 
@@ -753,7 +757,7 @@ branch refs/heads/main
     def test_cleanup_failed_worktree(self, mock_run, mock_rmtree, mock_exists):
         """Test _cleanup_failed_worktree removes directory and Git tracking."""
         mock_exists.return_value = True
-        mock_run.return_value = MagicMock()
+        mock_run.return_value = Mock()
 
         self.git_ops._cleanup_failed_worktree("/path/to/failed/worktree")
 
@@ -780,16 +784,14 @@ branch refs/heads/main
         # Should not raise an exception
         self.git_ops._cleanup_failed_worktree("/path/to/failed/worktree")
 
+    @patch("subprocess.Popen")
     @patch("subprocess.run")
-    def test_get_diff_summary_with_changes(self, mock_run):
+    def test_get_diff_summary_with_changes(self, mock_run, mock_popen):
         """Test get_diff_summary parses diff output with changes."""
-        mock_result = MagicMock()
-        mock_result.stdout = """10	6	file1.py
-5	0	file2.js
-0	3	file3.txt
-"""
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        mock_run.return_value = Mock(stdout="", returncode=128)
+        mock_popen.return_value = mock_git_process(
+            "10\t6\tfile1.py\x005\t0\tfile2.js\x000\t3\tfile3.txt\x00"
+        )
 
         result = self.git_ops.get_diff_summary("main", "feature")
 
@@ -800,22 +802,28 @@ branch refs/heads/main
         assert result.total_deletions == 9
         assert result.summary_text == "+15, -9"
 
+        # Refs are resolved first to build the cache key, then the diff runs
         mock_run.assert_called_once_with(
-            ["git", "diff", "--numstat", "--find-renames", "main...feature"],
+            ["git", "rev-parse", "main", "feature"],
             cwd=".",
             capture_output=True,
             text=True,
-            check=True,
-            timeout=30,
+            check=False,
+        )
+        mock_popen.assert_called_once_with(
+            ["git", "diff", "--numstat", "-z", "--no-renames", "main...feature"],
+            cwd=".",
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=1 << 20,
         )
 
+    @patch("subprocess.Popen")
     @patch("subprocess.run")
-    def test_get_diff_summary_no_changes(self, mock_run):
+    def test_get_diff_summary_no_changes(self, mock_run, mock_popen):
         """Test get_diff_summary handles no changes."""
-        mock_result = MagicMock()
-        mock_result.stdout = ""
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        mock_run.return_value = Mock(stdout="", returncode=128)
+        mock_popen.return_value = mock_git_process("")
 
         result = self.git_ops.get_diff_summary("main", "feature")
 
@@ -826,14 +834,12 @@ branch refs/heads/main
         assert result.total_deletions == 0
         assert result.summary_text == "No changes"
 
+    @patch("subprocess.Popen")
     @patch("subprocess.run")
-    def test_get_diff_summary_only_insertions(self, mock_run):
+    def test_get_diff_summary_only_insertions(self, mock_run, mock_popen):
         """Test get_diff_summary with only insertions."""
-        mock_result = MagicMock()
-        mock_result.stdout = """20	0	new_file.py
-"""
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        mock_run.return_value = Mock(stdout="", returncode=128)
+        mock_popen.return_value = mock_git_process("20\t0\tnew_file.py\x00")
 
         result = self.git_ops.get_diff_summary("main", "feature")
 
@@ -844,14 +850,12 @@ branch refs/heads/main
         assert result.total_deletions == 0
         assert result.summary_text == "+20"
 
+    @patch("subprocess.Popen")
     @patch("subprocess.run")
-    def test_get_diff_summary_only_deletions(self, mock_run):
+    def test_get_diff_summary_only_deletions(self, mock_run, mock_popen):
         """Test get_diff_summary with only deletions."""
-        mock_result = MagicMock()
-        mock_result.stdout = """0	15	old_file.py
-"""
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        mock_run.return_value = Mock(stdout="", returncode=128)
+        mock_popen.return_value = mock_git_process("0\t15\told_file.py\x00")
 
         result = self.git_ops.get_diff_summary("main", "feature")
 
@@ -862,16 +866,14 @@ branch refs/heads/main
         assert result.total_deletions == 15
         assert result.summary_text == "-15"
 
+    @patch("subprocess.Popen")
     @patch("subprocess.run")
-    def test_get_diff_summary_with_new_and_deleted_files(self, mock_run):
+    def test_get_diff_summary_with_new_and_deleted_files(self, mock_run, mock_popen):
         """Test get_diff_summary identifies new and deleted files."""
-        mock_result = MagicMock()
-        mock_result.stdout = """10	0	new_file.py
-0	5	deleted_file.py
-3	1	modified_file.py
-"""
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        mock_run.return_value = Mock(stdout="", returncode=128)
+        mock_popen.return_value = mock_git_process(
+            "10\t0\tnew_file.py\x000\t5\tdeleted_file.py\x003\t1\tmodified_file.py\x00"
+        )
 
         result = self.git_ops.get_diff_summary("main", "feature")
 
@@ -884,11 +886,13 @@ branch refs/heads/main
         assert result.total_deletions == 6
         assert result.summary_text == "+13, -6"
 
+    @patch("subprocess.Popen")
     @patch("subprocess.run")
-    def test_get_diff_summary_git_error(self, mock_run):
+    def test_get_diff_summary_git_error(self, mock_run, mock_popen):
         """Test get_diff_summary handles Git command errors."""
-        mock_run.side_effect = subprocess.CalledProcessError(
-            128, ["git", "diff"], stderr=b"Invalid branch"
+        mock_run.return_value = Mock(stdout="", returncode=128)
+        mock_popen.return_value = mock_git_process(
+            returncode=128, stderr=b"Invalid branch"
         )
 
         with pytest.raises(
@@ -897,14 +901,107 @@ branch refs/heads/main
         ):
             self.git_ops.get_diff_summary("main", "invalid")
 
+    @patch("subprocess.Popen")
+    @patch("subprocess.run")
+    def test_get_diff_summary_non_utf8_stderr(self, mock_run, mock_popen):
+        """Test undecodable git stderr still surfaces as a GitRepositoryError."""
+        mock_run.return_value = Mock(stdout="", returncode=128)
+        mock_popen.return_value = mock_git_process(
+            returncode=128, stderr=b"fatal: bad ref \xff"
+        )
+
+        with pytest.raises(GitRepositoryError, match="fatal: bad ref \ufffd"):
+            self.git_ops.get_diff_summary("main", "invalid")
+
+    @patch("subprocess.Popen")
     @patch("subprocess.run")
-    def test_get_diff_summary_git_not_installed(self, mock_run):
+    def test_get_diff_summary_git_not_installed(self, mock_run, mock_popen):
         """Test get_diff_summary handles missing Git installation."""
         mock_run.side_effect = FileNotFoundError("git command not found")
+        mock_popen.side_effect = FileNotFoundError("git command not found")
 
         with pytest.raises(GitRepositoryError, match="Git is not installed"):
             self.git_ops.get_diff_summary("main", "feature")
 
+    def test_run_git_decodes_output_once(self):
+        """Test _run_git returns stdout decoded with invalid bytes replaced."""
+        output = self.git_ops._run_git(
+            [sys.executable, "-c", "import sys; sys.stdout.buffer.write(b'ok\\xff')"],
+            timeout=30,
+        )
+
+        assert output == "ok�"
+
+    def test_run_git_nonzero_exit(self):
+        """Test _run_git raises CalledProcessError with stderr on failure."""
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            self.git_ops._run_git(
+                [sys.executable, "-c", "import sys; sys.exit('bad ref')"],
+                timeout=30,
+            )
+
+        assert exc_info.value.returncode == 1
+        assert b"bad ref" in exc_info.value.stderr
+
+    def test_run_git_timeout(self):
+        """Test _run_git kills the command and raises TimeoutExpired."""
+        with pytest.raises(subprocess.TimeoutExpired):
+            self.git_ops._run_git(
+                [sys.executable, "-c", "import time; time.sleep(10)"],
+                timeout=0.2,
+            )
+
+    def test_run_git_drains_large_stderr(self):
+        """Test _run_git doesn't block on a command writing lots of stderr."""
+        output = self.git_ops._run_git(
+            [
+                sys.executable,
+                "-c",
+                "import sys; sys.stderr.write('x' * 1000000); print('done')",
+            ],
+            timeout=30,
+        )
+
+        assert output.strip() == "done"
+
+    @patch("subprocess.Popen")
+    def test_run_git_kills_on_error(self, mock_popen):
+        """Test _run_git kills git if reading its output fails."""
+        process = mock_git_process()
+        process.stdout = Mock()
+        process.stdout.read1.side_effect = KeyboardInterrupt
+        mock_popen.return_value = process
+
+        with pytest.raises(KeyboardInterrupt):
+            self.git_ops._run_git(["git", "diff"], timeout=30)
+
+        process.kill.assert_called_once()
+
+    def test_read_numstat_records_timeout(self):
+        """Test _read_numstat_records kills the command and raises TimeoutExpired."""
+        with pytest.raises(subprocess.TimeoutExpired):
+            self.git_ops._read_numstat_records(
+                [sys.executable, "-c", "import time; time.sleep(10)"],
+                max_records=10,
+                timeout=0.2,
+            )
+
+    @patch("subprocess.Popen")
+    def test_read_numstat_records_kills_on_error(self, mock_popen):
+        """Test _read_numstat_records kills git if reading its output fails."""
+        process = mock_git_process()
+        process.stdout = Mock()
+        process.stdout.read1.side_effect = KeyboardInterrupt
+        mock_popen.return_value = process
+
+        with pytest.raises(KeyboardInterrupt):
+            self.git_ops._read_numstat_records(
+                ["git", "diff"], max_records=10, timeout=30
+            )
+
+        process.kill.assert_called_once()
+        process.wait.assert_called_once()
+
     def test_parse_diff_summary_empty_output(self):
         """Test _parse_diff_summary handles empty output."""
         result = self.git_ops._parse_diff_summary("")
@@ -934,6 +1031,45 @@ config/settings.json | 2 +-
         assert result.total_deletions == 13
         assert result.summary_text == "+37, -13"
 
+    def test_parse_diff_numstat_nul_terminated_output(self):
+        """Test _parse_diff_numstat handles 'git diff --numstat -z' output."""
+        numstat_output = (
+            "10\t6\tfile1.py\x00"
+            "5\t0\tname\nwith newline.txt\x00"
+            "-\t-\timage.png\x00"
+        )
+
+        result = self.git_ops._parse_diff_numstat(numstat_output)
+
+        assert result.files_modified == 2  # file1.py and the binary image.png
+        assert result.files_added == 1  # the path containing a newline
+        assert result.files_deleted == 0
+        assert result.total_insertions == 15
+        assert result.total_deletions == 6
+
+    def test_parse_diff_numstat_fused_returns_aggregates(self):
+        """Test _parse_diff_numstat_fused returns only the aggregate counters."""
+        numstat_output = "10\t6\tfile1.py\n5\t0\tfile2.py\nx\ty\tbad.py\n\nshort\n"
+
+        result = self.git_ops._parse_diff_numstat_fused(numstat_output)
+
+        # (modified, added, deleted, insertions, deletions); the malformed
+        # record counts as modified and incomplete records are skipped
+        assert result == (2, 1, 0, 15, 6)
+
+    def test_parse_diff_numstat_bytes_output(self):
+        """Test _parse_diff_numstat accepts undecoded bytes from git."""
+        numstat_output = b"10\t6\tfile1.py\x005\t0\tfile2.py\x00-\t-\timage.png\x00"
+
+        result = self.git_ops._parse_diff_numstat(numstat_output)
+
+        assert result.files_modified == 2
+        assert result.files_added == 1
+        assert result.files_deleted == 0
+        assert result.total_insertions == 15
+        assert result.total_deletions == 6
+        assert result.summary_text == "+15, -6"
+
 
 class TestGitOperationsCaching:
     """Test caching functionality in GitOperations."""
@@ -955,11 +1091,11 @@ class TestGitOperationsCaching:
     def test_get_branches_caching(self, mock_run):
         """Test that get_branches uses caching."""
         # Mock successful git branch commands
-        local_result = MagicMock()
+        local_result = Mock()
         local_result.stdout = "main\ndev\nfeature"
         local_result.returncode = 0
 
-        remote_result = MagicMock()
+        remote_result = Mock()
         remote_result.stdout = "origin/main\norigin/dev"
         remote_result.returncode = 0
 
@@ -983,7 +1119,7 @@ class TestGitOperationsCaching:
     def test_get_current_branch_caching(self, mock_run):
         """Test that get_current_branch uses caching."""
         # Mock successful git branch --show-current command
-        mock_result = MagicMock()
+        mock_result = Mock()
         mock_result.stdout = "main\n"
         mock_result.returncode = 0
         mock_run.return_value = mock_result
@@ -1005,7 +1141,7 @@ class TestGitOperationsCaching:
     def test_get_commit_info_caching(self, mock_run):
         """Test that get_commit_info uses caching."""
         # Mock successful git log command
-        mock_result = MagicMock()
+        mock_result = Mock()
         mock_result.stdout = (
             "abc123|Initial commit|John Doe|2023-01-01T12:00:00+00:00|abc123\n"
         )
@@ -1026,28 +1162,87 @@ class TestGitOperationsCaching:
         assert mock_run.call_count == 0
         assert commit1.hash == commit2.hash
 
+    @patch("subprocess.Popen")
     @patch("subprocess.run")
-    def test_get_diff_summary_caching(self, mock_run):
+    def test_get_diff_summary_caching(self, mock_run, mock_popen):
         """Test that get_diff_summary uses caching."""
-        # Mock successful git diff --numstat command
-        mock_result = MagicMock()
-        mock_result.stdout = "10\t5\tfile1.py\n5\t0\tfile2.py\n"
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        # Mock successful git rev-parse and git diff --numstat commands
+        rev_parse_result = Mock()
+        rev_parse_result.stdout = f"{'a' * 40}\n{'b' * 40}\n"
+        rev_parse_result.returncode = 0
+        mock_run.return_value = rev_parse_result
+        mock_popen.return_value = mock_git_process(
+            "10\t5\tfile1.py\x005\t0\tfile2.py\x00"
+        )
 
-        # First call should execute git command
+        # First call should resolve both refs in one call and execute git diff
         diff1 = self.git_ops_cached.get_diff_summary("main", "dev")
         assert mock_run.call_count == 1
+        assert mock_run.call_args[0][0] == ["git", "rev-parse", "main", "dev"]
+        assert mock_popen.call_count == 1
         assert diff1.total_insertions == 15
 
-        # Reset mock to verify caching
+        # Reset mocks to verify caching
         mock_run.reset_mock()
+        mock_popen.reset_mock()
 
         # Second call should use cache
         diff2 = self.git_ops_cached.get_diff_summary("main", "dev")
         assert mock_run.call_count == 0
+        assert mock_popen.call_count == 0
         assert diff1.total_insertions == diff2.total_insertions
 
+    @patch("subprocess.Popen")
+    @patch("subprocess.run")
+    def test_get_diff_summary_cache_keyed_by_sha(self, mock_run, mock_popen):
+        """Test that refs pointing at the same commits share a cache entry."""
+        rev_parse_result = Mock()
+        rev_parse_result.stdout = f"{'a' * 40}\n{'b' * 40}\n"
+        rev_parse_result.returncode = 0
+
+        alias_rev_parse_result = Mock()
+        alias_rev_parse_result.stdout = f"{'a' * 40}\n{'b' * 40}\n"
+        alias_rev_parse_result.returncode = 0
+
+        moved_rev_parse_result = Mock()
+        moved_rev_parse_result.stdout = f"{'c' * 40}\n"
+        moved_rev_parse_result.returncode = 0
+
+        mock_run.side_effect = [
+            rev_parse_result,
+            alias_rev_parse_result,
+            moved_rev_parse_result,
+        ]
+        mock_popen.side_effect = lambda *args, **kwargs: mock_git_process(
+            "10\t5\tfile1.py\x00"
+        )
+
+        self.git_ops_cached.get_diff_summary("main", "dev")
+        assert mock_run.call_count == 1
+        assert mock_popen.call_count == 1
+        # The diff runs on the SHAs the entry is keyed on, not the ref names
+        assert mock_popen.call_args[0][0][-1] == f"{'a' * 40}...{'b' * 40}"
+
+        # Different ref names resolving to the same commits hit the cache
+        self.git_ops_cached.get_diff_summary("origin/main", "origin/dev")
+        assert mock_run.call_count == 2
+        assert mock_popen.call_count == 1
+
+        # Full SHAs are used directly without calling git
+        self.git_ops_cached.get_diff_summary("a" * 40, "b" * 40)
+        assert mock_run.call_count == 2
+        assert mock_popen.call_count == 1
+
+        # Once the resolved ref expires and the branch has moved, diff is rerun
+        self.git_ops_cached._sha_cache.invalidate("dev")
+        self.git_ops_cached.get_diff_summary("main", "dev")
+        assert mock_run.call_args[0][0] == ["git", "rev-parse", "dev"]
+        assert mock_popen.call_count == 2
+
+        # Invalidating all diff summaries also forgets the resolved refs
+        self.git_ops_cached.invalidate_diff_summary_cache()
+        assert self.git_ops_cached._sha_cache.get("main") is None
+
     def test_cache_invalidation_methods(self):
         """Test cache invalidation methods."""
         # Set up some cached data
@@ -1084,15 +1279,36 @@ class TestGitOperationsCaching:
         removed_count = self.git_ops_cached.cleanup_expired_cache()
         assert removed_count >= 0  # Should remove at least 0 entries
 
+    def test_cache_methods_cover_diff_cache(self):
+        """Test the cache management methods include cached diff summaries."""
+        diff_cache = self.git_ops_cached._diff_cache
+        diff_cache.set(("a" * 40, "b" * 40), "diff")
+        diff_cache.set(("a" * 40, "c" * 40), "diff", ttl=0.001)
+        diff_cache.get(("a" * 40, "b" * 40))
+
+        stats = self.git_ops_cached.get_cache_stats()
+        assert stats["cache_size"] == 2
+        assert stats["hits"] == 1
+        assert stats["cache_bytes"] > 0
+        assert stats["diff_cache"]["hot_hits"] == 1
+
+        time.sleep(0.01)
+        assert self.git_ops_cached.cleanup_expired_cache() == 1
+
+        # Patterns that merely occur inside "diff_summary" leave it alone
+        assert self.git_ops_cached.invalidate_cache("s") == 0
+        assert self.git_ops_cached.invalidate_cache("diff_summary:main") == 1
+        assert self.git_ops_cached.get_cache_stats()["cache_size"] == 0
+
     @patch("subprocess.run")
     def test_uncached_operations(self, mock_run):
         """Test that uncached operations don't use cache."""
         # Mock successful git branch commands
-        local_result = MagicMock()
+        local_result = Mock()
         local_result.stdout = "main\n"
         local_result.returncode = 0
 
-        remote_result = MagicMock()
+        remote_result = Mock()
         remote_result.stdout = "origin/main\n"
         remote_result.returncode = 0
 
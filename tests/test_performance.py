@@ -1,16 +1,68 @@
 """Performance tests for Git operations."""
 
+import io
 import os
 import subprocess
 import tempfile
 import time
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Dict, List, Tuple, Union
+from unittest.mock import Mock, patch
 
 import pytest
 
 from git_worktree_manager.git_ops import GitOperations
 
+from .fakes import mock_git_process
 
+# Building blocks shared by the mock diff output generators
+_FILENAME_CACHE: Dict[Tuple[int, bool], List[Union[str, bytes]]] = {}
+_PLUS_BARS = ["+" * k for k in range(11)]
+_MINUS_BARS = ["−" * k for k in range(11)]
+
+
+def _filenames(num_files: int, as_bytes: bool = False) -> List[Union[str, bytes]]:
+    """Return the mock filenames file_0.py ... for num_files files, built once."""
+    names = _FILENAME_CACHE.get((num_files, as_bytes))
+    if names is None:
+        names = [f"file_{i}.py" for i in range(num_files)]
+        if as_bytes:
+            names = [name.encode() for name in names]
+        _FILENAME_CACHE[(num_files, as_bytes)] = names
+    return names
+
+
+def _mod5_sum(num_files: int) -> int:
+    """Return sum(i % 5 for i in range(num_files)) in constant time."""
+    full_cycles, remainder = divmod(num_files, 5)
+    return full_cycles * 10 + remainder * (remainder - 1) // 2
+
+
+@pytest.fixture
+def fast_git_stdout(monkeypatch):
+    """Replace subprocess.run with a stub returning one prebuilt result.
+
+    Returns a factory taking the stdout text and an optional return code. The
+    returned result records the commands it was run with in ``calls``.
+    """
+
+    def make(text: str, returncode: int = 0) -> SimpleNamespace:
+        result = SimpleNamespace(
+            stdout=text, returncode=returncode, stderr="", calls=[]
+        )
+
+        def run(cmd, *args, **kwargs):
+            result.calls.append(cmd)
+            return result
+
+        monkeypatch.setattr(subprocess, "run", run)
+        return result
+
+    return make
+
+
+# Timing assertions need a worker to themselves, see conftest
+@pytest.mark.xdist_group("performance")
 class TestGitOperationsPerformance:
     """Performance tests for GitOperations class."""
 
@@ -19,36 +71,42 @@ class TestGitOperationsPerformance:
         self.git_ops = GitOperations(enable_cache=True)
 
     @pytest.mark.performance
-    def test_diff_calculation_performance_with_caching(self):
+    def test_diff_calculation_performance_with_caching(self, fast_git_stdout):
         """Test diff calculation performance with caching enabled."""
         # Mock a large diff output
         large_diff_output = self._create_mock_large_diff_output(1000)
+        main_sha, dev_sha = "a" * 40, "b" * 40
+        rev_parse = fast_git_stdout(f"{main_sha}\n{dev_sha}\n")
 
-        with patch("subprocess.run") as mock_run:
-            mock_result = MagicMock()
-            mock_result.stdout = large_diff_output
-            mock_result.returncode = 0
-            mock_run.return_value = mock_result
+        with patch("subprocess.Popen") as mock_popen:
+            mock_popen.return_value = mock_git_process(large_diff_output)
 
             # First call - should be slower (cache miss)
-            start_time = time.time()
+            start = time.perf_counter_ns()
             diff1 = self.git_ops.get_diff_summary("main", "dev")
-            first_call_time = time.time() - start_time
+            first_call_ns = time.perf_counter_ns() - start
 
             # Second call - should be faster (cache hit)
-            start_time = time.time()
+            start = time.perf_counter_ns()
             diff2 = self.git_ops.get_diff_summary("main", "dev")
-            second_call_time = time.time() - start_time
+            second_call_ns = time.perf_counter_ns() - start
 
             # Verify results are the same
             assert diff1.files_modified == diff2.files_modified
             assert diff1.total_insertions == diff2.total_insertions
 
             # Cache hit should be significantly faster
-            assert second_call_time < first_call_time / 10  # At least 10x faster
+            assert second_call_ns < first_call_ns // 10  # At least 10x faster
 
-            # Verify cache was used (only one subprocess call)
-            assert mock_run.call_count == 1
+            # Verify cache was used (one rev-parse plus a single git diff call)
+            assert len(rev_parse.calls) == 1
+            assert mock_popen.call_count == 1
+
+            # Passing the resolved SHAs directly hits the same cache entry
+            diff3 = self.git_ops.get_diff_summary(main_sha, dev_sha)
+            assert diff3.total_insertions == diff1.total_insertions
+            assert len(rev_parse.calls) == 1
+            assert mock_popen.call_count == 1
 
     @pytest.mark.performance
     def test_diff_calculation_performance_without_caching(self):
@@ -56,26 +114,29 @@ class TestGitOperationsPerformance:
         git_ops_uncached = GitOperations(enable_cache=False)
         large_diff_output = self._create_mock_large_diff_output(500)
 
-        with patch("subprocess.run") as mock_run:
-            mock_result = MagicMock()
-            mock_result.stdout = large_diff_output
-            mock_result.returncode = 0
-            mock_run.return_value = mock_result
+        with patch("subprocess.Popen") as mock_popen:
+            # Build the mock processes up front so they aren't part of the timing
+            mock_popen.side_effect = [
+                mock_git_process(large_diff_output) for _ in range(4)
+            ]
+
+            # Warm up once so one-time setup doesn't skew the first timing
+            git_ops_uncached.get_diff_summary("main", "dev")
 
             # Multiple calls should all take similar time
-            times = []
+            times_ns = []
             for _ in range(3):
-                start_time = time.time()
+                start = time.perf_counter_ns()
                 git_ops_uncached.get_diff_summary("main", "dev")
-                times.append(time.time() - start_time)
+                times_ns.append(time.perf_counter_ns() - start)
 
             # All calls should execute subprocess (no caching)
-            assert mock_run.call_count == 3
+            assert mock_popen.call_count == 4
 
             # Times should be relatively consistent (no significant speedup)
-            avg_time = sum(times) / len(times)
-            for t in times:
-                assert abs(t - avg_time) / avg_time < 0.5  # Within 50% of average
+            avg_ns = sum(times_ns) / len(times_ns)
+            for t_ns in times_ns:
+                assert abs(t_ns - avg_ns) / avg_ns < 0.5  # Within 50% of average
 
     @pytest.mark.performance
     def test_numstat_parsing_performance(self):
@@ -85,18 +146,18 @@ class TestGitOperationsPerformance:
         stat_output = self._create_mock_stat_output(2000)
 
         # Test numstat parsing performance
-        start_time = time.time()
+        start = time.perf_counter_ns()
         result_numstat = self.git_ops._parse_diff_numstat(numstat_output)
-        numstat_time = time.time() - start_time
+        numstat_ns = time.perf_counter_ns() - start
 
         # Test stat parsing performance
-        start_time = time.time()
+        start = time.perf_counter_ns()
         result_stat = self.git_ops._parse_diff_summary(stat_output)
-        stat_time = time.time() - start_time
+        stat_ns = time.perf_counter_ns() - start
 
         # Both parsing methods should complete quickly (under 1 second)
-        assert numstat_time < 1.0
-        assert stat_time < 1.0
+        assert numstat_ns < 1_000_000_000
+        assert stat_ns < 1_000_000_000
 
         # Results should be comparable
         assert (
@@ -115,36 +176,30 @@ class TestGitOperationsPerformance:
     @pytest.mark.performance
     def test_progressive_loading_performance(self):
         """Test progressive loading performance."""
-        large_diff_output = self._create_mock_numstat_output(5000)
+        large_diff_output = self._create_mock_numstat_output(5000, as_bytes=True)
 
-        with patch("subprocess.run") as mock_run:
-            mock_result = MagicMock()
-            mock_result.stdout = large_diff_output
-            mock_result.returncode = 0
-            mock_run.return_value = mock_result
+        with patch("subprocess.Popen") as mock_popen:
+            mock_process = mock_git_process(large_diff_output)
+            mock_process.poll.return_value = None
+            mock_popen.side_effect = [
+                mock_process,
+                mock_git_process(large_diff_output),
+            ]
 
             # Test with file limit
-            start_time = time.time()
             diff_limited = self.git_ops.get_diff_summary_progressive(
                 "main", "dev", max_files=100
             )
-            limited_time = time.time() - start_time
 
-            # Reset mock for unlimited test
-            mock_run.reset_mock()
-            mock_run.return_value = mock_result
+            # Git is stopped once enough files were read
+            mock_process.terminate.assert_called_once()
 
             # Test without file limit
-            start_time = time.time()
             diff_unlimited = self.git_ops.get_diff_summary_progressive(
                 "main", "dev", max_files=None
             )
-            unlimited_time = time.time() - start_time
 
-            # Limited processing should be faster
-            assert limited_time <= unlimited_time
-
-            # Limited result should have fewer or equal files
+            # Limited result should have exactly max_files files
             limited_total = (
                 diff_limited.files_modified
                 + diff_limited.files_added
@@ -155,20 +210,44 @@ class TestGitOperationsPerformance:
                 + diff_unlimited.files_added
                 + diff_unlimited.files_deleted
             )
-            assert limited_total <= unlimited_total
+            assert limited_total == 100
+            assert unlimited_total == 5000
+
+    @pytest.mark.performance
+    def test_progressive_loading_reads_only_max_files(self):
+        """Test limited loading stops reading git output after max_files records."""
+        chunk = b"1\t0\tfile.py\x00" * 10
+        mock_process = mock_git_process(b"")
+        mock_process.stdout = Mock()
+        mock_process.stdout.read1.return_value = chunk  # Endless output
+        mock_process.poll.return_value = None
+
+        with patch("subprocess.Popen", return_value=mock_process):
+            output = self.git_ops._read_numstat_records(
+                ["git", "diff"], max_records=25, timeout=30
+            )
+
+        # Three chunks of ten records cover the limit, then git is stopped
+        assert mock_process.stdout.read1.call_count == 3
+        mock_process.terminate.assert_called_once()
+        assert output.count(b"\x00") == 25
 
     @pytest.mark.performance
-    def test_performance_metrics_collection(self):
+    def test_performance_metrics_collection(self, fast_git_stdout):
         """Test performance metrics collection."""
-        with patch("subprocess.run") as mock_run:
-            mock_result = MagicMock()
-            mock_result.stdout = self._create_mock_numstat_output(100)
-            mock_result.returncode = 0
-            mock_run.return_value = mock_result
+        numstat_output = self._create_mock_numstat_output(100)
+        fast_git_stdout("", returncode=128)
 
-            # Perform several operations
-            for i in range(5):
-                self.git_ops.get_diff_summary(f"branch{i}", "main")
+        with patch("subprocess.Popen") as mock_popen:
+            mock_popen.side_effect = lambda *args, **kwargs: mock_git_process(
+                numstat_output
+            )
+
+            # Perform several operations concurrently
+            pairs = [(f"branch{i}", "main") for i in range(5)]
+            results = self.git_ops.get_diff_summaries_batch(pairs)
+            assert len(results) == 5
+            assert mock_popen.call_count == 5
 
             # Check performance metrics
             metrics = self.git_ops.get_performance_metrics()
@@ -180,45 +259,49 @@ class TestGitOperationsPerformance:
             assert diff_metrics["average_time"] > 0
             assert diff_metrics["max_time"] >= diff_metrics["min_time"]
 
+            # Repeat lookups are served from the hot layer of the diff cache
+            self.git_ops.get_diff_summary("branch0", "main")
+            assert "diff_cache" not in self.git_ops.get_performance_metrics()
+            cache_metrics = self.git_ops.get_cache_stats()["diff_cache"]
+            assert cache_metrics["misses"] == 5
+            assert cache_metrics["hot_hits"] == 1
+            assert cache_metrics["cold_hits"] == 0
+
     @pytest.mark.performance
-    def test_cache_performance_with_large_dataset(self):
+    def test_cache_performance_with_large_dataset(self, fast_git_stdout):
         """Test cache performance with large datasets."""
-        # Create a large number of different cache entries
-        with patch("subprocess.run") as mock_run:
-            mock_result = MagicMock()
-            mock_result.stdout = "main\ndev\nfeature"
-            mock_result.returncode = 0
-            mock_run.return_value = mock_result
-
-            # Fill cache with many entries
-            start_time = time.time()
-            for i in range(100):
-                # This will create different cache keys
-                self.git_ops._cache.set(f"test_key_{i}", f"test_value_{i}")
-            cache_fill_time = time.time() - start_time
-
-            # Test cache retrieval performance
-            start_time = time.time()
-            for i in range(100):
-                value = self.git_ops._cache.get(f"test_key_{i}")
-                assert value == f"test_value_{i}"
-            cache_retrieval_time = time.time() - start_time
-
-            # Cache operations should be fast
-            assert cache_fill_time < 1.0  # Should take less than 1 second
-            assert cache_retrieval_time < 0.1  # Should take less than 100ms
-
-            # Check cache stats
-            stats = self.git_ops.get_cache_stats()
-            assert stats["cache_size"] == 100
-            assert stats["hits"] == 100
+        fast_git_stdout("main\ndev\nfeature")
+
+        # Fill cache with many different entries
+        start = time.perf_counter_ns()
+        for i in range(100):
+            # This will create different cache keys
+            self.git_ops._cache.set(f"test_key_{i}", f"test_value_{i}")
+        cache_fill_ns = time.perf_counter_ns() - start
+
+        # Test cache retrieval performance
+        start = time.perf_counter_ns()
+        for i in range(100):
+            value = self.git_ops._cache.get(f"test_key_{i}")
+            assert value == f"test_value_{i}"
+        cache_retrieval_ns = time.perf_counter_ns() - start
+
+        # Cache operations should be fast
+        assert cache_fill_ns < 1_000_000_000  # Should take less than 1 second
+        assert cache_retrieval_ns < 100_000_000  # Should take less than 100ms
+
+        # Check cache stats
+        stats = self.git_ops.get_cache_stats()
+        assert stats["cache_size"] == 100
+        assert stats["hits"] == 100
 
     @pytest.mark.performance
     def test_memory_usage_with_large_cache(self):
         """Test memory usage with large cache entries."""
 
         # Get initial memory usage (approximate)
-        initial_cache_size = len(str(self.git_ops._cache._cache))
+        initial_cache_bytes = self.git_ops.get_cache_stats()["cache_bytes"]
+        assert initial_cache_bytes == 0
 
         # Add large cache entries
         large_data = "x" * 10000  # 10KB string
@@ -226,85 +309,112 @@ class TestGitOperationsPerformance:
             self.git_ops._cache.set(f"large_key_{i}", large_data)
 
         # Check cache size growth
-        final_cache_size = len(str(self.git_ops._cache._cache))
+        stats = self.git_ops.get_cache_stats()
+        assert stats["cache_bytes"] >= 100 * len(large_data)
 
-        # Cache should have grown significantly
-        assert final_cache_size > initial_cache_size * 10
+        # Overwriting an entry doesn't double count it
+        self.git_ops._cache.set("large_key_0", large_data)
+        assert self.git_ops.get_cache_stats()["cache_bytes"] == stats["cache_bytes"]
 
         # Clear cache and verify cleanup
         self.git_ops._cache.clear()
-        cleared_cache_size = len(str(self.git_ops._cache._cache))
-
-        # Cache should be much smaller after clearing
-        assert cleared_cache_size < initial_cache_size * 2
+        assert self.git_ops.get_cache_stats()["cache_bytes"] == 0
 
     @pytest.mark.performance
-    def test_timeout_handling_performance(self):
+    def test_timeout_handling_performance(self, fast_git_stdout):
         """Test timeout handling doesn't significantly impact performance."""
-        with patch("subprocess.run") as mock_run:
+        fast_git_stdout("", returncode=128)
+
+        with patch("subprocess.Popen") as mock_popen:
             # Mock a quick response
-            mock_result = MagicMock()
-            mock_result.stdout = "1\t2\tfile.txt"
-            mock_result.returncode = 0
-            mock_run.return_value = mock_result
+            mock_popen.side_effect = lambda *args, **kwargs: mock_git_process(
+                "1\t2\tfile.txt\x00"
+            )
 
             # Time multiple operations with timeout
-            start_time = time.time()
+            start = time.perf_counter_ns()
             for _ in range(10):
                 self.git_ops.get_diff_summary("main", "dev")
-            total_time = time.time() - start_time
+            total_ns = time.perf_counter_ns() - start
+
+            # Operations should complete quickly despite timeout parameter;
+            # 10 operations should take less than 1 second
+            assert total_ns < 1_000_000_000
 
-            # Operations should complete quickly despite timeout parameter
-            assert total_time < 1.0  # Should take less than 1 second for 10 operations
+    def test_mock_deletions_closed_form(self):
+        """Test the closed-form deletions total used by the mock generators."""
+        for n in (0, 1, 4, 5, 100):
+            assert _mod5_sum(n) == sum(i % 5 for i in range(n))
 
     def _create_mock_large_diff_output(self, num_files: int) -> str:
         """Create mock diff --stat output for testing."""
-        lines = []
-        for i in range(num_files):
-            filename = f"file_{i}.py"
-            changes = f" {filename} | {i + 1} {'+'*(i % 10)}{'−'*(i % 5)}"
-            lines.append(changes)
+        buf = io.StringIO()
+        write = buf.write
+        fmt = " %s | %d %s%s\n"
+        for i, name in enumerate(_filenames(num_files)):
+            write(fmt % (name, i + 1, _PLUS_BARS[i % 10], _MINUS_BARS[i % 5]))
 
         # Add summary line
-        total_files = num_files
-        total_insertions = sum(range(1, num_files + 1))
-        total_deletions = sum(i % 5 for i in range(num_files))
+        total_insertions = num_files * (num_files + 1) // 2
+        total_deletions = _mod5_sum(num_files)
+        write(
+            f" {num_files} files changed, {total_insertions} insertions(+),"
+            f" {total_deletions} deletions(-)"
+        )
 
-        summary = f" {total_files} files changed, {total_insertions} insertions(+), {total_deletions} deletions(-)"
-        lines.append(summary)
+        return buf.getvalue()
 
-        return "\n".join(lines)
+    def _create_mock_numstat_output(
+        self, num_files: int, as_bytes: bool = False
+    ) -> Union[str, bytes]:
+        """Create mock diff --numstat -z output for testing.
 
-    def _create_mock_numstat_output(self, num_files: int) -> str:
-        """Create mock diff --numstat output for testing."""
-        lines = []
-        for i in range(num_files):
-            insertions = i + 1
-            deletions = i % 5
-            filename = f"file_{i}.py"
-            lines.append(f"{insertions}\t{deletions}\t{filename}")
+        With as_bytes the output is built directly as bytes, the form git
+        writes to the pipe, so no encoding pass is needed.
+        """
+        if as_bytes:
+            out = bytearray()
+            extend = out.extend
+            fmt = b"%d\t%d\t%s\x00"
+            for i, name in enumerate(_filenames(num_files, as_bytes=True)):
+                extend(fmt % (i + 1, i % 5, name))
+            return bytes(out)
+
+        buf = io.StringIO()
+        write = buf.write
+        fmt = "%d\t%d\t%s\x00"
+        for i, name in enumerate(_filenames(num_files)):
+            write(fmt % (i + 1, i % 5, name))
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _create_mock_stat_output(self, num_files: int) -> str:
         """Create mock diff --stat output for testing."""
-        lines = []
-        for i in range(num_files):
-            filename = f"file_{i}.py"
+        buf = io.StringIO()
+        write = buf.write
+        fmt = " %s | %d %s%s\n"
+        for i, name in enumerate(_filenames(num_files)):
             insertions = i + 1
             deletions = i % 5
-            changes = f" {filename} | {insertions + deletions} {'+'*min(insertions, 10)}{'−'*min(deletions, 10)}"
-            lines.append(changes)
+            write(
+                fmt
+                % (
+                    name,
+                    insertions + deletions,
+                    _PLUS_BARS[min(insertions, 10)],
+                    _MINUS_BARS[deletions],
+                )
+            )
 
         # Add summary line
-        total_files = num_files
-        total_insertions = sum(range(1, num_files + 1))
-        total_deletions = sum(i % 5 for i in range(num_files))
-
-        summary = f" {total_files} files changed, {total_insertions} insertions(+), {total_deletions} deletions(-)"
-        lines.append(summary)
+        total_insertions = num_files * (num_files + 1) // 2
+        total_deletions = _mod5_sum(num_files)
+        write(
+            f" {num_files} files changed, {total_insertions} insertions(+),"
+            f" {total_deletions} deletions(-)"
+        )
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
 
 class TestRealRepositoryPerformance:
@@ -329,28 +439,28 @@ class TestRealRepositoryPerformance:
         git_ops = GitOperations(enable_cache=True)
 
         # Test branch listing performance
-        start_time = time.time()
+        start = time.perf_counter_ns()
         branches = git_ops.get_branches()
-        branch_time = time.time() - start_time
+        branch_ns = time.perf_counter_ns() - start
 
         assert len(branches) > 0
-        assert branch_time < 5.0  # Should complete within 5 seconds
+        assert branch_ns < 5_000_000_000  # Should complete within 5 seconds
 
         # Test current branch performance
-        start_time = time.time()
+        start = time.perf_counter_ns()
         current_branch = git_ops.get_current_branch()
-        current_branch_time = time.time() - start_time
+        current_branch_ns = time.perf_counter_ns() - start
 
         assert current_branch is not None
-        assert current_branch_time < 1.0  # Should complete within 1 second
+        assert current_branch_ns < 1_000_000_000  # Should complete within 1 second
 
         # Test caching performance (second call should be faster)
-        start_time = time.time()
+        start = time.perf_counter_ns()
         branches2 = git_ops.get_branches()
-        cached_branch_time = time.time() - start_time
+        cached_branch_ns = time.perf_counter_ns() - start
 
         assert branches == branches2
-        assert cached_branch_time < branch_time / 5  # Should be at least 5x faster
+        assert cached_branch_ns < branch_ns // 5  # Should be at least 5x faster
 
     @pytest.mark.slow
     @pytest.mark.integration
@@ -416,9 +526,9 @@ class TestRealRepositoryPerformance:
             git_ops = GitOperations(repo_path=temp_dir, enable_cache=True)
 
             # Test diff calculation performance
-            start_time = time.time()
+            start = time.perf_counter_ns()
             diff_summary = git_ops.get_diff_summary("main", "feature")
-            diff_time = time.time() - start_time
+            diff_ns = time.perf_counter_ns() - start
 
             # Verify results - files should be detected as added since they're new
             total_files_changed = (
@@ -427,20 +537,20 @@ class TestRealRepositoryPerformance:
                 + diff_summary.files_deleted
             )
             assert total_files_changed > 0
-            assert diff_time < 2.0  # Should complete within 2 seconds
+            assert diff_ns < 2_000_000_000  # Should complete within 2 seconds
 
             # Test progressive loading
-            start_time = time.time()
+            start = time.perf_counter_ns()
             diff_progressive = git_ops.get_diff_summary_progressive(
                 "main", "feature", max_files=10
             )
-            progressive_time = time.time() - start_time
+            progressive_ns = time.perf_counter_ns() - start
 
             # Progressive loading should be reasonably fast (within 50% margin for small datasets)
             # In larger datasets, progressive loading would show more significant benefits
             # For small test datasets, timing can vary significantly due to overhead
-            assert progressive_time <= max(
-                diff_time * 1.5, 0.1
+            assert progressive_ns <= max(
+                diff_ns * 3 // 2, 100_000_000
             )  # Allow 50% margin or 100ms max
 
             # Check performance metrics
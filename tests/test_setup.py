@@ -1,5 +1,6 @@
 """Tests for package setup and installation."""
 
+import hashlib
 import subprocess
 import sys
 import tempfile
@@ -8,6 +9,17 @@ from pathlib import Path
 import pytest
 
 
+def _build_inputs_hash(project_root: Path) -> str:
+    """Hash the files that determine the built package."""
+    digest = hashlib.sha256()
+    sources = [project_root / "pyproject.toml", project_root / "README.md"]
+    sources += sorted((project_root / "git_worktree_manager").rglob("*.py"))
+    for path in sources:
+        digest.update(path.relative_to(project_root).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
 class TestPackageSetup:
     """Test package setup and installation."""
 
@@ -91,12 +103,24 @@ class TestPackageSetup:
         != 0,
         reason="build module not available",
     )
-    def test_package_builds(self):
-        """Test that the package can be built."""
+    def test_package_builds(self, request):
+        """Test that the package can be built.
+
+        Built distributions are kept in the pytest cache, keyed on the build
+        inputs, so the build only reruns when the package changed. Without the
+        cache plugin (-p no:cacheprovider) the package is always built.
+        """
         import shutil
         from pathlib import Path
 
         project_root = Path(__file__).parent.parent
+        cache = getattr(request.config, "cache", None)
+        cached_dist = None
+        if cache is not None:
+            cached_dist = cache.mkdir("builds") / _build_inputs_hash(project_root)
+            if list(cached_dist.glob("*.whl")):
+                # Already built successfully from identical sources
+                return
 
         with tempfile.TemporaryDirectory() as temp_dir:
             # Copy project to temp directory
@@ -127,6 +151,9 @@ class TestPackageSetup:
             dist_files = list(dist_dir.glob("*"))
             assert len(dist_files) > 0, "No distribution files created"
 
+            if cached_dist is not None:
+                shutil.copytree(dist_dir, cached_dist, dirs_exist_ok=True)
+
 
 class TestInstallation:
     """Test installation scenarios."""
@@ -1,33 +1,56 @@
 """Unit tests for WorktreeManager class."""
 
+from dataclasses import replace
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call
 
 import pytest
 
+from git_worktree_manager.config import ConfigError
 from git_worktree_manager.git_ops import GitRepositoryError
-from git_worktree_manager.models import CommitInfo, DiffSummary, WorktreeInfo
+from git_worktree_manager.models import DiffSummary, WorktreeInfo
 from git_worktree_manager.worktree_manager import (
     WorktreeCreationError,
     WorktreeManager,
 )
 
+# Keep these tests on one xdist worker so they share its fixtures
+pytestmark = pytest.mark.xdist_group("worktree_manager")
+
+_BRANCHES_DEFAULT = ("main", "develop", "feature/test")
+_NONEMPTY_DIR = ("some_file",)
+
+# Shared read-only sample data, the manager builds new objects from these
+_SAMPLE_WORKTREES = (
+    WorktreeInfo(
+        path="/repo",
+        branch="main",
+        commit_hash="abc123",
+        commit_message="Initial commit",
+        is_bare=True,
+    ),
+    WorktreeInfo(
+        path="/worktrees/feature",
+        branch="feature/test",
+        commit_hash="def456",
+        commit_message="Feature commit",
+    ),
+)
+_SAMPLE_WORKTREE = _SAMPLE_WORKTREES[1]
+_SAMPLE_WORKTREE_FROM_MAIN = replace(_SAMPLE_WORKTREE, base_branch="main")
+_SAMPLE_DIFF = DiffSummary(
+    files_modified=2,
+    files_added=1,
+    files_deleted=0,
+    total_insertions=15,
+    total_deletions=5,
+    summary_text="+15, -5",
+)
+
 
 class TestWorktreeManager:
     """Test cases for WorktreeManager class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_git_ops = Mock()
-        self.mock_ui_controller = Mock()
-        self.mock_config_manager = Mock()
-
-        self.manager = WorktreeManager(
-            git_ops=self.mock_git_ops,
-            ui_controller=self.mock_ui_controller,
-            config_manager=self.mock_config_manager,
-        )
-
     def test_init_with_defaults(self):
         """Test WorktreeManager initialization with default dependencies."""
         manager = WorktreeManager()
@@ -35,194 +58,185 @@ class TestWorktreeManager:
         assert manager.ui_controller is not None
         assert manager.config_manager is not None
 
-    def test_init_with_custom_dependencies(self):
+    def test_init_with_custom_dependencies(self, manager):
         """Test WorktreeManager initialization with custom dependencies."""
-        assert self.manager.git_ops == self.mock_git_ops
-        assert self.manager.ui_controller == self.mock_ui_controller
-        assert self.manager.config_manager == self.mock_config_manager
+        manager, git_ops, ui_controller, config_manager = manager
+
+        assert manager.git_ops == git_ops
+        assert manager.ui_controller == ui_controller
+        assert manager.config_manager == config_manager
 
 
 class TestCreateWorktree:
     """Test cases for create_worktree method."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_git_ops = Mock()
-        self.mock_ui_controller = Mock()
-        self.mock_config_manager = Mock()
-
-        self.manager = WorktreeManager(
-            git_ops=self.mock_git_ops,
-            ui_controller=self.mock_ui_controller,
-            config_manager=self.mock_config_manager,
-        )
-
-        # Default mock responses
-        self.mock_git_ops.is_git_repository.return_value = True
-        self.mock_git_ops.get_branches.return_value = [
-            "main",
-            "develop",
-            "feature/test",
-        ]
-        self.mock_git_ops.get_current_branch.return_value = "main"
-        self.mock_git_ops.create_worktree.return_value = None
-        self.mock_git_ops.get_commit_info.return_value = CommitInfo(
-            hash="abc123def456",
-            message="Test commit",
-            author="Test Author",
-            date=None,
-            short_hash="abc123d",
-        )
-        self.mock_git_ops._has_uncommitted_changes.return_value = False
-
-        self.mock_config_manager.get_default_worktree_location.return_value = (
-            "/home/user/worktrees"
-        )
-
-        self.mock_ui_controller.prompt_branch_name.return_value = "feature/new-feature"
-        self.mock_ui_controller.select_base_branch.return_value = "main"
-        self.mock_ui_controller.select_worktree_location.return_value = (
-            "/home/user/worktrees/feature-new-feature"
-        )
-
-    def test_create_worktree_with_all_parameters(self):
+    def test_create_worktree_with_all_parameters(self, create_manager):
         """Test creating worktree with all parameters provided."""
-        result = self.manager.create_worktree(
+        manager, git_ops, ui_controller, *_ = create_manager
+
+        result = manager.create_worktree(
             branch_name="feature/test",
             base_branch="main",
             location="/tmp/test-worktree",
         )
 
-        # Verify Git operations were called
-        self.mock_git_ops.is_git_repository.assert_called_once()
-        self.mock_git_ops.create_worktree.assert_called_once_with(
-            "/tmp/test-worktree", "feature/test", "main"
-        )
+        # Verify the Git operations, in order
+        assert git_ops.mock_calls == [
+            call.is_git_repository(),
+            call.get_branches(),
+            call.get_current_branch(),
+            call.create_worktree("/tmp/test-worktree", "feature/test", "main"),
+            call.get_commit_info("feature/test"),
+            call._has_uncommitted_changes("/tmp/test-worktree"),
+        ]
 
         # Verify UI interactions
-        self.mock_ui_controller.start_progress.assert_called()
-        self.mock_ui_controller.stop_progress.assert_called()
-        self.mock_ui_controller.display_success.assert_called()
+        ui_controller.start_progress.assert_called()
+        ui_controller.stop_progress.assert_called()
+        ui_controller.display_success.assert_called()
 
         # Verify result
         assert isinstance(result, WorktreeInfo)
         assert result.branch == "feature/test"
         assert result.path == "/tmp/test-worktree"
 
-    def test_create_worktree_with_interactive_prompts(self):
+    def test_create_worktree_with_interactive_prompts(
+        self, create_manager, monkeypatch
+    ):
         """Test creating worktree with interactive prompts."""
-        # Mock the _get_default_worktree_path method directly
-        with patch.object(self.manager, "_get_default_worktree_path") as mock_get_path:
-            mock_get_path.return_value = "/home/user/worktrees/feature-new-feature"
-
-            # Mock the _ensure_parent_directory method to avoid filesystem operations
-            with patch.object(
-                self.manager, "_ensure_parent_directory"
-            ) as mock_ensure_dir:
-                result = self.manager.create_worktree()
-
-                # Verify interactive prompts were called
-                self.mock_ui_controller.prompt_branch_name.assert_called_once()
-                self.mock_ui_controller.select_base_branch.assert_called_once()
-                self.mock_ui_controller.select_worktree_location.assert_called_once()
-
-                # Verify Git operations
-                self.mock_git_ops.create_worktree.assert_called_once_with(
-                    "/home/user/worktrees/feature-new-feature",
-                    "feature/new-feature",
-                    "main",
-                )
-
-                # Verify parent directory creation was attempted
-                mock_ensure_dir.assert_called_once_with(
-                    "/home/user/worktrees/feature-new-feature"
-                )
-
-                assert isinstance(result, WorktreeInfo)
-
-    def test_create_worktree_not_in_git_repository(self):
-        """Test creating worktree when not in a Git repository."""
-        self.mock_git_ops.is_git_repository.return_value = False
-
-        with pytest.raises(WorktreeCreationError, match="Not in a Git repository"):
-            self.manager.create_worktree()
-
-    def test_create_worktree_git_operations_fail(self):
-        """Test creating worktree when Git operations fail."""
-        self.mock_git_ops.get_branches.side_effect = GitRepositoryError(
-            "Git command failed"
+        manager, git_ops, ui_controller, *_ = create_manager
+
+        monkeypatch.setattr(
+            manager,
+            "_get_default_worktree_path",
+            Mock(return_value="/home/user/worktrees/feature-new-feature"),
+        )
+        # Avoid touching the filesystem
+        ensure_parent_directory = Mock()
+        monkeypatch.setattr(
+            manager, "_ensure_parent_directory", ensure_parent_directory
         )
 
-        with pytest.raises(
-            WorktreeCreationError, match="Failed to get branch information"
-        ):
-            self.manager.create_worktree()
+        result = manager.create_worktree()
 
-    def test_create_worktree_user_cancellation(self):
-        """Test creating worktree when user cancels operation."""
-        self.mock_ui_controller.prompt_branch_name.side_effect = KeyboardInterrupt()
+        # Verify interactive prompts were called
+        ui_controller.prompt_branch_name.assert_called_once()
+        ui_controller.select_base_branch.assert_called_once()
+        ui_controller.select_worktree_location.assert_called_once()
 
-        with pytest.raises(WorktreeCreationError, match="Operation cancelled by user"):
-            self.manager.create_worktree()
+        # Verify Git operations
+        git_ops.create_worktree.assert_called_once_with(
+            "/home/user/worktrees/feature-new-feature",
+            "feature/new-feature",
+            "main",
+        )
 
-    def test_create_worktree_creation_fails(self):
-        """Test creating worktree when Git worktree creation fails."""
-        self.mock_git_ops.create_worktree.side_effect = GitRepositoryError(
-            "Worktree creation failed"
+        # Verify parent directory creation was attempted
+        ensure_parent_directory.assert_called_once_with(
+            "/home/user/worktrees/feature-new-feature"
         )
 
-        with pytest.raises(WorktreeCreationError, match="Failed to create worktree"):
-            self.manager.create_worktree(
-                branch_name="test", base_branch="main", location="/tmp/test"
-            )
+        assert isinstance(result, WorktreeInfo)
 
-    def test_create_worktree_validation_errors(self):
+    @pytest.mark.parametrize(
+        "target,value,kwargs,message",
+        [
+            pytest.param(
+                "git_ops.is_git_repository.return_value",
+                False,
+                {},
+                "Not in a Git repository",
+                id="not_in_git_repository",
+            ),
+            pytest.param(
+                "git_ops.get_branches.side_effect",
+                GitRepositoryError("Git command failed"),
+                {},
+                "Failed to get branch information",
+                id="git_operations_fail",
+            ),
+            pytest.param(
+                "ui_controller.prompt_branch_name.side_effect",
+                KeyboardInterrupt(),
+                {},
+                "Operation cancelled by user",
+                id="user_cancellation",
+            ),
+            pytest.param(
+                "git_ops.create_worktree.side_effect",
+                GitRepositoryError("Worktree creation failed"),
+                {"branch_name": "test", "base_branch": "main", "location": "/tmp/test"},
+                "Failed to create worktree",
+                id="creation_fails",
+            ),
+        ],
+    )
+    def test_create_worktree_errors(
+        self, create_manager, target, value, kwargs, message
+    ):
+        """Test failures along the way surface as WorktreeCreationError."""
+        manager, git_ops, ui_controller, _ = create_manager
+        dependencies = {"git_ops": git_ops, "ui_controller": ui_controller}
+
+        dependency, attribute = target.split(".", 1)
+        dependencies[dependency].configure_mock(**{attribute: value})
+
+        with pytest.raises(WorktreeCreationError, match=message):
+            manager.create_worktree(**kwargs)
+
+    @pytest.mark.parametrize(
+        "branch,base,location,message",
+        [
+            ("", "main", "/tmp/test", "Branch name cannot be empty"),
+            ("test", "", "/tmp/test", "Base branch cannot be empty"),
+            ("test", "main", "", "Location cannot be empty"),
+        ],
+        ids=["empty_branch", "empty_base", "empty_location"],
+    )
+    def test_create_worktree_validation_errors(
+        self, create_manager, branch, base, location, message
+    ):
         """Test worktree creation with invalid inputs."""
-        # Empty branch name
-        with pytest.raises(WorktreeCreationError, match="Branch name cannot be empty"):
-            self.manager.create_worktree(
-                branch_name="", base_branch="main", location="/tmp/test"
-            )
-
-        # Empty base branch
-        with pytest.raises(WorktreeCreationError, match="Base branch cannot be empty"):
-            self.manager.create_worktree(
-                branch_name="test", base_branch="", location="/tmp/test"
-            )
+        manager, *_ = create_manager
 
-        # Empty location
-        with pytest.raises(WorktreeCreationError, match="Location cannot be empty"):
-            self.manager.create_worktree(
-                branch_name="test", base_branch="main", location=""
+        with pytest.raises(WorktreeCreationError, match=message):
+            manager.create_worktree(
+                branch_name=branch, base_branch=base, location=location
             )
 
-    @patch("git_worktree_manager.worktree_manager.Path")
-    def test_create_worktree_location_is_file(self, mock_path):
+    def test_create_worktree_location_is_file(self, create_manager, monkeypatch):
         """Test worktree creation when location is an existing file."""
+        manager, *_ = create_manager
+
         mock_location = Mock()
         mock_location.exists.return_value = True
         mock_location.is_file.return_value = True
-        mock_path.return_value = mock_location
+        monkeypatch.setattr(
+            "git_worktree_manager.worktree_manager.Path", lambda *args: mock_location
+        )
 
         with pytest.raises(WorktreeCreationError, match="Location is a file"):
-            self.manager.create_worktree(
+            manager.create_worktree(
                 branch_name="test", base_branch="main", location="/tmp/existing-file"
             )
 
-    @patch("git_worktree_manager.worktree_manager.Path")
-    def test_create_worktree_location_not_empty(self, mock_path):
+    def test_create_worktree_location_not_empty(self, create_manager, monkeypatch):
         """Test worktree creation when location is a non-empty directory."""
+        manager, *_ = create_manager
+
         mock_location = Mock()
         mock_location.exists.return_value = True
         mock_location.is_file.return_value = False
         mock_location.is_dir.return_value = True
-        mock_location.iterdir.return_value = ["some_file"]  # Non-empty
-        mock_path.return_value = mock_location
+        mock_location.iterdir.return_value = _NONEMPTY_DIR
+        monkeypatch.setattr(
+            "git_worktree_manager.worktree_manager.Path", lambda *args: mock_location
+        )
 
         with pytest.raises(
             WorktreeCreationError, match="already exists and is not empty"
         ):
-            self.manager.create_worktree(
+            manager.create_worktree(
                 branch_name="test", base_branch="main", location="/tmp/non-empty-dir"
             )
 
@@ -230,379 +244,286 @@ class TestCreateWorktree:
 class TestListWorktrees:
     """Test cases for list_worktrees method."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_git_ops = Mock()
-        self.mock_ui_controller = Mock()
-        self.mock_config_manager = Mock()
+    @pytest.fixture
+    def manager(self, shared_manager):
+        """Manager whose Git mock lists the sample worktrees."""
+        _, git_ops, *_ = shared_manager
 
-        self.manager = WorktreeManager(
-            git_ops=self.mock_git_ops,
-            ui_controller=self.mock_ui_controller,
-            config_manager=self.mock_config_manager,
-        )
+        git_ops.list_worktrees.return_value = _SAMPLE_WORKTREES
+        git_ops._has_uncommitted_changes.return_value = False
+        return shared_manager
 
-        # Sample worktree data
-        self.sample_worktrees = [
-            WorktreeInfo(
-                path="/repo",
-                branch="main",
-                commit_hash="abc123",
-                commit_message="Initial commit",
-                is_bare=True,
-            ),
-            WorktreeInfo(
-                path="/worktrees/feature",
-                branch="feature/test",
-                commit_hash="def456",
-                commit_message="Feature commit",
-            ),
-        ]
-
-        self.mock_git_ops.list_worktrees.return_value = self.sample_worktrees
-        self.mock_git_ops._has_uncommitted_changes.return_value = False
-
-    def test_list_worktrees_success(self):
+    def test_list_worktrees_success(self, manager):
         """Test successful worktree listing."""
-        result = self.manager.list_worktrees()
+        manager, git_ops, *_ = manager
 
-        self.mock_git_ops.list_worktrees.assert_called_once()
+        result = manager.list_worktrees()
+
+        git_ops.list_worktrees.assert_called_once()
         assert len(result) == 2
         assert all(isinstance(wt, WorktreeInfo) for wt in result)
 
-    def test_list_worktrees_with_caching(self):
-        """Test worktree listing with caching."""
-        # First call
-        result1 = self.manager.list_worktrees()
+    @pytest.mark.parametrize("calls", [2, 5, 10])
+    def test_list_worktrees_with_caching(self, manager, calls):
+        """Test repeated worktree listings are served from the cache."""
+        manager, git_ops, *_ = manager
 
-        # Second call should use cache
-        result2 = self.manager.list_worktrees()
+        first = manager.list_worktrees()
+        for _ in range(calls - 1):
+            assert manager.list_worktrees() == first
 
         # Git operations should only be called once
-        self.mock_git_ops.list_worktrees.assert_called_once()
-        assert result1 == result2
+        git_ops.list_worktrees.assert_called_once()
 
-    def test_list_worktrees_git_error(self):
+    def test_list_worktrees_git_error(self, manager):
         """Test worktree listing when Git operations fail."""
-        self.mock_git_ops.list_worktrees.side_effect = GitRepositoryError(
-            "Git command failed"
-        )
+        manager, git_ops, *_ = manager
+
+        git_ops.list_worktrees.side_effect = GitRepositoryError("Git command failed")
 
         with pytest.raises(GitRepositoryError):
-            self.manager.list_worktrees()
+            manager.list_worktrees()
 
-    def test_list_worktrees_enhancement_error(self):
+    def test_list_worktrees_enhancement_error(self, manager):
         """Test worktree listing when enhancement fails gracefully."""
-        self.mock_git_ops._has_uncommitted_changes.side_effect = Exception(
-            "Enhancement failed"
-        )
+        manager, git_ops, *_ = manager
+
+        git_ops._has_uncommitted_changes.side_effect = Exception("Enhancement failed")
 
         # Should not raise exception, but return original worktrees
-        result = self.manager.list_worktrees()
+        result = manager.list_worktrees()
         assert len(result) == 2
 
 
 class TestGetWorktreeStatus:
     """Test cases for get_worktree_status method."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_git_ops = Mock()
-        self.mock_ui_controller = Mock()
-        self.mock_config_manager = Mock()
+    @pytest.fixture
+    def manager(self, shared_manager):
+        """Manager whose Git mock reports uncommitted changes."""
+        _, git_ops, *_ = shared_manager
 
-        self.manager = WorktreeManager(
-            git_ops=self.mock_git_ops,
-            ui_controller=self.mock_ui_controller,
-            config_manager=self.mock_config_manager,
-        )
-
-        self.sample_worktree = WorktreeInfo(
-            path="/worktrees/feature",
-            branch="feature/test",
-            commit_hash="def456",
-            commit_message="Feature commit",
-        )
+        git_ops._has_uncommitted_changes.return_value = True
+        return shared_manager
 
-        self.mock_git_ops._has_uncommitted_changes.return_value = True
-
-    def test_get_worktree_status_success(self):
+    def test_get_worktree_status_success(self, manager):
         """Test successful worktree status retrieval."""
-        result = self.manager.get_worktree_status(self.sample_worktree)
+        manager, git_ops, *_ = manager
 
-        self.mock_git_ops._has_uncommitted_changes.assert_called_once_with(
-            "/worktrees/feature"
-        )
+        result = manager.get_worktree_status(_SAMPLE_WORKTREE)
+
+        git_ops._has_uncommitted_changes.assert_called_once_with("/worktrees/feature")
         assert isinstance(result, WorktreeInfo)
         assert result.has_uncommitted_changes is True
-        assert result.path == self.sample_worktree.path
-        assert result.branch == self.sample_worktree.branch
+        assert result.path == _SAMPLE_WORKTREE.path
+        assert result.branch == _SAMPLE_WORKTREE.branch
 
-    def test_get_worktree_status_error(self):
+    def test_get_worktree_status_error(self, manager):
         """Test worktree status when operations fail gracefully."""
-        self.mock_git_ops._has_uncommitted_changes.side_effect = Exception(
-            "Status check failed"
-        )
+        manager, git_ops, *_ = manager
+
+        git_ops._has_uncommitted_changes.side_effect = Exception("Status check failed")
 
         # Should not raise exception, but return original worktree due to graceful error handling
-        result = self.manager.get_worktree_status(self.sample_worktree)
+        result = manager.get_worktree_status(_SAMPLE_WORKTREE)
 
         assert isinstance(result, WorktreeInfo)
-        assert result.path == self.sample_worktree.path
-        assert result.branch == self.sample_worktree.branch
+        assert result.path == _SAMPLE_WORKTREE.path
+        assert result.branch == _SAMPLE_WORKTREE.branch
 
 
 class TestCalculateDiffSummary:
     """Test cases for calculate_diff_summary method."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_git_ops = Mock()
-        self.mock_ui_controller = Mock()
-        self.mock_config_manager = Mock()
-
-        self.manager = WorktreeManager(
-            git_ops=self.mock_git_ops,
-            ui_controller=self.mock_ui_controller,
-            config_manager=self.mock_config_manager,
-        )
+    @pytest.fixture
+    def manager(self, shared_manager):
+        """Manager whose Git mock returns the sample diff."""
+        _, git_ops, *_ = shared_manager
 
-        self.sample_worktree = WorktreeInfo(
-            path="/worktrees/feature",
-            branch="feature/test",
-            commit_hash="def456",
-            commit_message="Feature commit",
-            base_branch="main",
-        )
+        git_ops.get_diff_summary.return_value = _SAMPLE_DIFF
+        return shared_manager
 
-        self.sample_diff = DiffSummary(
-            files_modified=2,
-            files_added=1,
-            files_deleted=0,
-            total_insertions=15,
-            total_deletions=5,
-            summary_text="+15, -5",
-        )
-
-        self.mock_git_ops.get_diff_summary.return_value = self.sample_diff
-
-    def test_calculate_diff_summary_with_base_branch(self):
+    def test_calculate_diff_summary_with_base_branch(self, manager):
         """Test diff calculation with explicit base branch."""
-        result = self.manager.calculate_diff_summary(self.sample_worktree, "develop")
+        manager, git_ops, *_ = manager
 
-        self.mock_git_ops.get_diff_summary.assert_called_once_with(
-            "develop", "feature/test"
-        )
-        assert result == self.sample_diff
+        result = manager.calculate_diff_summary(_SAMPLE_WORKTREE_FROM_MAIN, "develop")
 
-    def test_calculate_diff_summary_with_worktree_base_branch(self):
+        git_ops.get_diff_summary.assert_called_once_with("develop", "feature/test")
+        assert result == _SAMPLE_DIFF
+
+    def test_calculate_diff_summary_with_worktree_base_branch(self, manager):
         """Test diff calculation using worktree's base branch."""
-        result = self.manager.calculate_diff_summary(self.sample_worktree)
+        manager, git_ops, *_ = manager
 
-        self.mock_git_ops.get_diff_summary.assert_called_once_with(
-            "main", "feature/test"
-        )
-        assert result == self.sample_diff
+        result = manager.calculate_diff_summary(_SAMPLE_WORKTREE_FROM_MAIN)
+
+        git_ops.get_diff_summary.assert_called_once_with("main", "feature/test")
+        assert result == _SAMPLE_DIFF
 
-    def test_calculate_diff_summary_no_base_branch(self):
+    def test_calculate_diff_summary_no_base_branch(self, manager):
         """Test diff calculation when no base branch is available."""
-        worktree_no_base = WorktreeInfo(
-            path="/worktrees/feature",
-            branch="feature/test",
-            commit_hash="def456",
-            commit_message="Feature commit",
-        )
+        manager, git_ops, *_ = manager
 
-        self.mock_git_ops.get_current_branch.return_value = "main"
+        git_ops.get_current_branch.return_value = "main"
 
-        result = self.manager.calculate_diff_summary(worktree_no_base)
+        result = manager.calculate_diff_summary(_SAMPLE_WORKTREE)
 
-        self.mock_git_ops.get_diff_summary.assert_called_once_with(
-            "main", "feature/test"
-        )
-        assert result == self.sample_diff
+        git_ops.get_diff_summary.assert_called_once_with("main", "feature/test")
+        assert result == _SAMPLE_DIFF
 
-    def test_calculate_diff_summary_fallback_to_main(self):
+    def test_calculate_diff_summary_fallback_to_main(self, manager):
         """Test diff calculation fallback to main branch."""
-        worktree_no_base = WorktreeInfo(
-            path="/worktrees/feature",
-            branch="feature/test",
-            commit_hash="def456",
-            commit_message="Feature commit",
-        )
+        manager, git_ops, *_ = manager
 
-        self.mock_git_ops.get_current_branch.return_value = (
-            "feature/test"  # Same as worktree
-        )
-        self.mock_git_ops.get_branches.return_value = [
-            "main",
-            "develop",
-            "feature/test",
-        ]
+        git_ops.get_current_branch.return_value = "feature/test"  # Same as worktree
+        git_ops.get_branches.return_value = _BRANCHES_DEFAULT
 
-        result = self.manager.calculate_diff_summary(worktree_no_base)
+        result = manager.calculate_diff_summary(_SAMPLE_WORKTREE)
 
-        self.mock_git_ops.get_diff_summary.assert_called_once_with(
-            "main", "feature/test"
-        )
-        assert result == self.sample_diff
+        git_ops.get_diff_summary.assert_called_once_with("main", "feature/test")
+        assert result == _SAMPLE_DIFF
 
-    def test_calculate_diff_summary_no_suitable_base(self):
+    def test_calculate_diff_summary_no_suitable_base(self, manager):
         """Test diff calculation when no suitable base branch found."""
-        worktree_no_base = WorktreeInfo(
-            path="/worktrees/feature",
-            branch="feature/test",
-            commit_hash="def456",
-            commit_message="Feature commit",
-        )
+        manager, git_ops, *_ = manager
 
-        self.mock_git_ops.get_current_branch.return_value = "feature/test"
-        self.mock_git_ops.get_branches.return_value = ["feature/test", "feature/other"]
+        git_ops.get_current_branch.return_value = "feature/test"
+        git_ops.get_branches.return_value = ["feature/test", "feature/other"]
 
-        result = self.manager.calculate_diff_summary(worktree_no_base)
+        result = manager.calculate_diff_summary(_SAMPLE_WORKTREE)
 
         assert result is None
 
-    def test_calculate_diff_summary_with_caching(self):
-        """Test diff calculation with caching."""
-        # First call
-        result1 = self.manager.calculate_diff_summary(self.sample_worktree)
+    @pytest.mark.parametrize("calls", [2, 5, 10])
+    def test_calculate_diff_summary_with_caching(self, manager, calls):
+        """Test repeated diff calculations are served from the cache."""
+        manager, git_ops, *_ = manager
 
-        # Second call should use cache
-        result2 = self.manager.calculate_diff_summary(self.sample_worktree)
+        first = manager.calculate_diff_summary(_SAMPLE_WORKTREE_FROM_MAIN)
+        for _ in range(calls - 1):
+            assert manager.calculate_diff_summary(_SAMPLE_WORKTREE_FROM_MAIN) == first
 
         # Git operations should only be called once
-        self.mock_git_ops.get_diff_summary.assert_called_once()
-        assert result1 == result2
+        git_ops.get_diff_summary.assert_called_once()
 
-    def test_calculate_diff_summary_missing_branch_error(self):
+    def test_calculate_diff_summary_missing_branch_error(self, manager):
         """Test diff calculation when base branch doesn't exist."""
-        self.mock_git_ops.get_diff_summary.side_effect = GitRepositoryError(
-            "unknown revision"
-        )
+        manager, git_ops, *_ = manager
+
+        git_ops.get_diff_summary.side_effect = GitRepositoryError("unknown revision")
 
-        result = self.manager.calculate_diff_summary(self.sample_worktree)
+        result = manager.calculate_diff_summary(_SAMPLE_WORKTREE_FROM_MAIN)
 
         # Should return None for missing branch errors
         assert result is None
 
-    def test_calculate_diff_summary_other_git_error(self):
+    def test_calculate_diff_summary_other_git_error(self, manager):
         """Test diff calculation with other Git errors."""
-        self.mock_git_ops.get_diff_summary.side_effect = GitRepositoryError(
-            "Other Git error"
-        )
+        manager, git_ops, *_ = manager
+
+        git_ops.get_diff_summary.side_effect = GitRepositoryError("Other Git error")
 
         with pytest.raises(GitRepositoryError):
-            self.manager.calculate_diff_summary(self.sample_worktree)
+            manager.calculate_diff_summary(_SAMPLE_WORKTREE_FROM_MAIN)
 
 
 class TestCacheManagement:
     """Test cases for cache management functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_git_ops = Mock()
-        self.mock_ui_controller = Mock()
-        self.mock_config_manager = Mock()
-
-        self.manager = WorktreeManager(
-            git_ops=self.mock_git_ops,
-            ui_controller=self.mock_ui_controller,
-            config_manager=self.mock_config_manager,
-        )
-
-    def test_clear_caches(self):
+    def test_clear_caches(self, manager):
         """Test cache clearing functionality."""
+        manager, *_ = manager
+
         # Set up some cached data
-        self.manager._branch_cache = ["main", "develop"]
-        self.manager._worktree_cache = [Mock()]
-        self.manager._diff_cache = {"key": Mock()}
+        manager._branch_cache = ["main", "develop"]
+        manager._worktree_cache = [Mock()]
+        manager._diff_cache = {"key": Mock()}
 
         # Clear caches
-        self.manager._clear_caches()
+        manager._clear_caches()
 
         # Verify caches are cleared
-        assert self.manager._branch_cache is None
-        assert self.manager._worktree_cache is None
-        assert len(self.manager._diff_cache) == 0
+        assert manager._branch_cache is None
+        assert manager._worktree_cache is None
+        assert len(manager._diff_cache) == 0
 
-    def test_get_branches_cached(self):
+    def test_get_branches_cached(self, manager):
         """Test cached branch retrieval."""
-        self.mock_git_ops.get_branches.return_value = ["main", "develop"]
+        manager, git_ops, *_ = manager
+
+        git_ops.get_branches.return_value = ["main", "develop"]
 
         # First call
-        result1 = self.manager._get_branches_cached()
+        result1 = manager._get_branches_cached()
 
         # Second call should use cache
-        result2 = self.manager._get_branches_cached()
+        result2 = manager._get_branches_cached()
 
         # Git operations should only be called once
-        self.mock_git_ops.get_branches.assert_called_once()
+        git_ops.get_branches.assert_called_once()
         assert result1 == result2 == ["main", "develop"]
 
 
 class TestHelperMethods:
     """Test cases for helper methods."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_git_ops = Mock()
-        self.mock_ui_controller = Mock()
-        self.mock_config_manager = Mock()
-
-        self.manager = WorktreeManager(
-            git_ops=self.mock_git_ops,
-            ui_controller=self.mock_ui_controller,
-            config_manager=self.mock_config_manager,
-        )
-
-    def test_get_default_worktree_path(self):
+    def test_get_default_worktree_path(self, manager):
         """Test default worktree path generation."""
-        self.mock_config_manager.get_default_worktree_location.return_value = (
+        manager, _, _, config_manager = manager
+
+        config_manager.get_default_worktree_location.return_value = (
             "/home/user/worktrees"
         )
 
-        result = self.manager._get_default_worktree_path("feature/test")
+        result = manager._get_default_worktree_path("feature/test")
 
         assert result == "/home/user/worktrees/feature/test"
 
-    def test_get_default_worktree_path_config_error(self):
+    def test_get_default_worktree_path_config_error(self, manager, monkeypatch):
         """Test default worktree path with config error fallback."""
-        from git_worktree_manager.config import ConfigError
+        manager, _, _, config_manager = manager
 
-        self.mock_config_manager.get_default_worktree_location.side_effect = (
-            ConfigError("Config failed")
+        config_manager.get_default_worktree_location.side_effect = ConfigError(
+            "Config failed"
+        )
+        monkeypatch.setattr(
+            "git_worktree_manager.worktree_manager.Path.home",
+            lambda: Path("/home/user"),
         )
 
-        with patch("git_worktree_manager.worktree_manager.Path") as mock_path:
-            mock_path.home.return_value = Path("/home/user")
-
-            result = self.manager._get_default_worktree_path("feature/test")
+        result = manager._get_default_worktree_path("feature/test")
 
-            assert "/home/user/worktrees/feature/test" in result
+        assert "/home/user/worktrees/feature/test" in result
 
-    @patch("git_worktree_manager.worktree_manager.Path")
-    def test_ensure_parent_directory_success(self, mock_path):
+    def test_ensure_parent_directory_success(self, manager, monkeypatch):
         """Test successful parent directory creation."""
+        manager, *_ = manager
+
         mock_location = Mock()
         mock_parent = Mock()
         mock_location.parent = mock_parent
-        mock_path.return_value = mock_location
+        monkeypatch.setattr(
+            "git_worktree_manager.worktree_manager.Path", lambda *args: mock_location
+        )
 
-        self.manager._ensure_parent_directory("/tmp/test/worktree")
+        manager._ensure_parent_directory("/tmp/test/worktree")
 
         mock_parent.mkdir.assert_called_once_with(parents=True, exist_ok=True)
 
-    @patch("git_worktree_manager.worktree_manager.Path")
-    def test_ensure_parent_directory_error(self, mock_path):
+    def test_ensure_parent_directory_error(self, manager, monkeypatch):
         """Test parent directory creation error."""
+        manager, *_ = manager
+
         mock_location = Mock()
         mock_parent = Mock()
         mock_parent.mkdir.side_effect = OSError("Permission denied")
         mock_location.parent = mock_parent
-        mock_path.return_value = mock_location
+        monkeypatch.setattr(
+            "git_worktree_manager.worktree_manager.Path", lambda *args: mock_location
+        )
 
         with pytest.raises(
             WorktreeCreationError, match="Failed to create parent directory"
         ):
-            self.manager._ensure_parent_directory("/tmp/test/worktree")
+            manager._ensure_parent_directory("/tmp/test/worktree")